@@ -1,17 +1,19 @@
 import logging
+from functools import lru_cache
 from typing import Any, Dict, List
 
 import voluptuous as vol
-from datetime import timedelta
 
 from homeassistant.const import CONF_NAME
 from homeassistant.const import CONF_SCAN_INTERVAL
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryError
 from homeassistant.helpers import discovery
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers import entity_registry as er
 from homeassistant.util import slugify
 
+from .coordinator import _coalesce_spans
 from .const import (
     DOMAIN,
     CONF_HUB,
@@ -38,7 +40,14 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
-SUPPORTED_TYPES = {
+
+@lru_cache(maxsize=1024)
+def _slug(name: str) -> str:
+    """Memoized slugify; device names repeat across reloads and restarts."""
+    return slugify(name)
+
+
+SUPPORTED_TYPES = frozenset({
     DEVICE_TYPE_RGB_LIGHT,
     DEVICE_TYPE_WHITE_LIGHT,
     DEVICE_TYPE_MOTION_SENSOR,
@@ -46,7 +55,10 @@ SUPPORTED_TYPES = {
     DEVICE_TYPE_IO_MODULE,
     DEVICE_TYPE_DIMMER,
     DEVICE_TYPE_GROUP_SWITCH,
-}
+})
+
+# Entity domains this integration manages (stale-entity cleanup)
+_HANDLED_DOMAINS = frozenset(("light", "switch", "binary_sensor", "sensor"))
 
 # Schema definitions
 DEVICE_SCHEMA = vol.Schema(
@@ -77,98 +89,93 @@ CONFIG_SCHEMA = vol.Schema(
 
 PLATFORMS = ["light", "binary_sensor", "switch", "sensor"]
 
-async def async_setup(hass: HomeAssistant, config: Dict[str, Any]):
-    """Set up the ISYGLT integration via YAML."""
-    conf = config.get(DOMAIN)
-    if conf is None:
-        _LOGGER.debug("No ISYGLT configuration found")
-        return True
+# Registers occupied per device type (default 1)
+_REG_COUNT = {
+    DEVICE_TYPE_RGB_LIGHT: LIGHT_REGISTER_COUNT_RGB,
+    DEVICE_TYPE_WHITE_LIGHT: LIGHT_REGISTER_COUNT_WHITE,
+    DEVICE_TYPE_DIMMER: LIGHT_REGISTER_COUNT_DIMMER,
+    DEVICE_TYPE_MOTION_SENSOR: 3,  # ch0 zones + ch1/ch2 illuminance word
+    DEVICE_TYPE_BUTTON_GRID: 2,  # ch0+ch1
+    DEVICE_TYPE_IO_MODULE: 2,
+}
 
+async def _async_setup_hub(hass: HomeAssistant, conf: Dict[str, Any]):
+    """Shared hub setup: domain state, stale-entity cleanup and bulk ranges."""
     hub_name: str = conf[CONF_HUB]
     devices: List[Dict[str, Any]] = conf.get(CONF_DEVICES, [])
     poll_interval: float = conf.get(CONF_POLL_INTERVAL, DEFAULT_POLL_INTERVAL)
 
     # Determine bulk Modbus range for this hub
     spans = []
-    if devices:
-        min_addr = min(d[CONF_ADDRESS] for d in devices)
-    else:
-        min_addr = 0
-
     for d in devices:
-        reg_cnt = 1
-        if d[CONF_TYPE] == DEVICE_TYPE_RGB_LIGHT:
-            reg_cnt = LIGHT_REGISTER_COUNT_RGB
-        elif d[CONF_TYPE] == DEVICE_TYPE_WHITE_LIGHT:
-            reg_cnt = LIGHT_REGISTER_COUNT_WHITE
-        elif d[CONF_TYPE] == DEVICE_TYPE_DIMMER:
-            reg_cnt = LIGHT_REGISTER_COUNT_DIMMER
-        elif d[CONF_TYPE] == DEVICE_TYPE_MOTION_SENSOR:
-            reg_cnt = 2  # motion sensor ch0+ch1 minimal
-        elif d[CONF_TYPE] == DEVICE_TYPE_BUTTON_GRID:
-            reg_cnt = 2  # ch0+ch1
-        elif d[CONF_TYPE] == DEVICE_TYPE_IO_MODULE:
-            reg_cnt = 2
+        reg_cnt = _REG_COUNT.get(d[CONF_TYPE], 1)
         start = d[CONF_ADDRESS]
-        end = start + reg_cnt - 1
-        spans.append((start, end))
-
-    spans.sort()
-    BLOCK_LIMIT = 125
-    GAP_THRESHOLD = 16  # registers; if gap larger, start new range
-    ranges = []
-    if spans:
-        cur_start, cur_end = spans[0]
-        for s, e in spans[1:]:
-            if s - cur_end - 1 <= GAP_THRESHOLD and (e - cur_start + 1) <= BLOCK_LIMIT:
-                cur_end = max(cur_end, e)
-            else:
-                ranges.append((cur_start, cur_end - cur_start + 1))
-                cur_start, cur_end = s, e
-        ranges.append((cur_start, cur_end - cur_start + 1))
+        spans.append((start, start + reg_cnt - 1))
+
+    ranges = _coalesce_spans(spans)
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN]["hub"] = hub_name
     hass.data[DOMAIN]["devices"] = devices
     hass.data[DOMAIN]["poll_interval"] = poll_interval
-    hass.data[DOMAIN].setdefault("bulk_throttle", {})[hub_name] = 0.0
-    hass.data[DOMAIN].setdefault("last_write", {})[hub_name] = 0.0
 
     # --- Clean up stale entities ---
-    valid_prefixes = [f"{hub_name}_{slugify(d[CONF_NAME])}_{d[CONF_TYPE]}" for d in devices]
+    # Tuple so str.startswith matches all prefixes in a single C call.
+    valid_prefixes = tuple(f"{hub_name}_{_slug(d[CONF_NAME])}_{d[CONF_TYPE]}" for d in devices)
     ent_reg = er.async_get(hass)
-    for entry in list(ent_reg.entities.values()):
-        if entry.domain not in ("light", "switch", "binary_sensor", "sensor"):
-            continue
-        if entry.platform != DOMAIN:
-            continue
-        if not any(entry.unique_id.startswith(p) for p in valid_prefixes):
-            _LOGGER.debug("Removing stale ISYGLT entity %s", entry.entity_id)
-            ent_reg.async_remove(entry.entity_id)
+    # Iterate the registry view directly and only collect the ids to drop;
+    # removal happens afterwards so no full copy of the registry is made.
+    stale_entities = [
+        e.entity_id
+        for e in ent_reg.entities.values()
+        if e.platform == DOMAIN
+        and e.domain in _HANDLED_DOMAINS
+        and not e.unique_id.startswith(valid_prefixes)
+    ]
+    for entity_id in stale_entities:
+        _LOGGER.debug("Removing stale ISYGLT entity %s", entity_id)
+        ent_reg.async_remove(entity_id)
 
     # Remove stale devices with no remaining entities
     from homeassistant.helpers import device_registry as dr
     dev_reg = dr.async_get(hass)
-    for dev in list(dev_reg.devices.values()):
-        if not any(idt[0] == DOMAIN for idt in dev.identifiers):
-            continue
-        # if device has no entities now, remove it
-        if not any(e.device_id == dev.id for e in ent_reg.entities.values()):
-            _LOGGER.debug("Removing stale ISYGLT device %s", dev.id)
-            dev_reg.async_remove_device(dev.id)
-
-    valid_ranges = [r for r in ranges if r[1] <= BLOCK_LIMIT]
-    if valid_ranges:
-        hass.data[DOMAIN].setdefault("bulk_range", {})[hub_name] = valid_ranges
-
-    scan_td = timedelta(seconds=poll_interval * 2)
-
-    # Import platform modules in executor so setting SCAN_INTERVAL occurs before HA reads it
-    import importlib
-    for platform in PLATFORMS:
-        module = await hass.async_add_executor_job(importlib.import_module, f". {platform}".replace(" ", ""), __name__)
-        setattr(module, "SCAN_INTERVAL", scan_td)
+    stale_devices = [
+        dev.id
+        for dev in dev_reg.devices.values()
+        if any(idt[0] == DOMAIN for idt in dev.identifiers)
+        and not any(e.device_id == dev.id for e in ent_reg.entities.values())
+    ]
+    for dev_id in stale_devices:
+        _LOGGER.debug("Removing stale ISYGLT device %s", dev_id)
+        dev_reg.async_remove_device(dev_id)
+
+    if ranges:
+        hass.data[DOMAIN].setdefault("bulk_range", {})[hub_name] = ranges
+        # One bulk read per range per cycle feeds the shared coordinator
+        # data that entities decode from instead of reading individually.
+        from .coordinator import async_get_coordinator
+
+        coordinator = async_get_coordinator(hass, hub_name, poll_interval)
+        # Populate the register image before platforms add their
+        # entities: one bulk fetch replaces every entity's first poll
+        # and new entities come up with real state, not unknown.
+        await coordinator.async_refresh()
+
+    return hub_name, devices, poll_interval
 
+
+async def async_setup(hass: HomeAssistant, config: Dict[str, Any]):
+    """Set up the ISYGLT integration via YAML."""
+    conf = config.get(DOMAIN)
+    if conf is None:
+        _LOGGER.debug("No ISYGLT configuration found")
+        return True
+
+    hub_name, devices, poll_interval = await _async_setup_hub(hass, conf)
+
+    # Platforms derive their scan interval from poll_interval in
+    # discovery_info; no need to pre-import and patch SCAN_INTERVAL here.
+    for platform in PLATFORMS:
         _LOGGER.debug("Forwarding setup for platform %s", platform)
         hass.async_create_task(
             discovery.async_load_platform(
@@ -189,8 +196,6 @@ async def async_setup(hass: HomeAssistant, config: Dict[str, Any]):
 
 async def async_setup_entry(hass: HomeAssistant, entry):
     """Set up ISYGLT from a config entry (config flow)."""
-    from .const import CONF_POLL_INTERVAL
-
     data = entry.data
     options = entry.options
 
@@ -201,4 +206,17 @@ async def async_setup_entry(hass: HomeAssistant, entry):
             CONF_DEVICES: options.get(CONF_DEVICES, []),
         }
     }
-    return await async_setup(hass, yaml_like) 
\ No newline at end of file
+    # HA core only runs CONFIG_SCHEMA for YAML setups; validate the
+    # config-entry path through the same pre-compiled schema so device
+    # dicts are normalized (defaults, coercions) exactly once either way.
+    # The YAML-paste import flow only checks devices are dicts, so bad
+    # entries must fail setup cleanly rather than with a raw traceback.
+    try:
+        yaml_like = CONFIG_SCHEMA(yaml_like)
+    except vol.Invalid as err:
+        raise ConfigEntryError(f"Invalid ISYGLT device configuration: {err}") from err
+    await _async_setup_hub(hass, yaml_like[DOMAIN])
+
+    # Forward all platforms in one batch instead of one discovery task each
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    return True 
\ No newline at end of file
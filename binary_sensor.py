@@ -1,17 +1,14 @@
 import logging
 from typing import List
-from datetime import timedelta
 
 from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
     BinarySensorDeviceClass,
 )
 from homeassistant.const import CONF_NAME
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.core import callback
 from homeassistant.helpers.entity import Entity
-from homeassistant.helpers import device_registry as dr
-from homeassistant.util import slugify
-
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .const import (
     CONF_ADDRESS,
     DEVICE_TYPE_MOTION_SENSOR,
@@ -21,39 +18,10 @@ from .const import (
     ATTR_INPUT,
     DOMAIN,
 )
-from .helpers import IsyGltModbusMixin
+from .helpers import IsyGltModbusMixin, build_device_meta
 
 _LOGGER = logging.getLogger(__name__)
 
-MOTION_ZONE_BITS = {
-    1: 0x01,
-    2: 0x02,
-    3: 0x04,
-    4: 0x08,
-}
-
-BUTTON_BITS = {
-    1: 0x01,
-    2: 0x02,
-    3: 0x04,
-    4: 0x08,
-    5: 0x10,
-    6: 0x20,
-}
-
-IO_INPUT_BITS = {
-    1: 0x01,
-    2: 0x02,
-    3: 0x04,
-    4: 0x08,
-    5: 0x10,
-    6: 0x20,
-    7: 0x40,
-    8: 0x80,
-}
-
-SCAN_INTERVAL = timedelta(seconds=1)
-
 
 async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
     if discovery_info is None:
@@ -64,173 +32,187 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
 
     entities: List[Entity] = []
 
-    if discovery_info and "poll_interval" in discovery_info:
-        global SCAN_INTERVAL
-        base = float(discovery_info["poll_interval"])
-        SCAN_INTERVAL = timedelta(seconds=base * 2)
-
     for dev in devices:
-        dev_type = dev.get("type")
-        if dev_type == DEVICE_TYPE_MOTION_SENSOR:
-            for zone in range(1, 5):
-                entities.append(IsyGltMotionZoneSensor(hass, hub_name, dev, zone))
-            entities.append(IsyGltMotionAnySensor(hass, hub_name, dev))
-        elif dev_type == DEVICE_TYPE_IO_MODULE:
-            for idx in range(1, 9):
-                entities.append(IsyGltIOInputSensor(hass, hub_name, dev, idx))
-        elif dev_type == DEVICE_TYPE_BUTTON_GRID:
-            for btn in range(1, 7):
-                entities.append(IsyGltButtonSensor(hass, hub_name, dev, btn))
+        build = _BINARY_BUILD.get(dev.get("type"))
+        if build is None:
+            continue
+        cls, count, extra_cls = build
+        meta = build_device_meta(hass, hub_name, dev)
+        entities.extend(
+            cls(hass, hub_name, dev, *meta, idx) for idx in range(1, count + 1)
+        )
+        if extra_cls is not None:
+            entities.append(extra_cls(hass, hub_name, dev, *meta))
 
     if entities:
         async_add_entities(entities)
 
 
-class IsyGltBaseBinarySensor(IsyGltModbusMixin, BinarySensorEntity):
-    def __init__(self, hass, hub_name: str, cfg: dict):
+async def async_setup_entry(hass, entry, async_add_entities):
+    """Set up ISYGLT binary sensors from a config entry (forwarded platforms)."""
+    data = hass.data[DOMAIN]
+    await async_setup_platform(
+        hass,
+        {},
+        async_add_entities,
+        discovery_info={
+            "devices": data.get("devices", []),
+            "hub": data.get("hub"),
+            "poll_interval": data.get("poll_interval", 1.0),
+        },
+    )
+
+
+class IsyGltBaseBinarySensor(IsyGltModbusMixin, CoordinatorEntity, BinarySensorEntity):
+    """Binary sensor deriving its state from the shared hub coordinator."""
+
+    def __init__(self, hass, hub_name: str, cfg: dict, base_id: str, device_info: dict, device_entry):
         IsyGltModbusMixin.__init__(self, hass, hub_name)
+        CoordinatorEntity.__init__(self, hass.data[DOMAIN]["coordinator"][hub_name])
         self._cfg = cfg
         self._name_prefix = cfg[CONF_NAME]
         self._address = cfg[CONF_ADDRESS]
-        base_id = f"{hub_name}_{slugify(cfg[CONF_NAME])}_{cfg['type']}"
-        self.device_entry = self.ensure_device_entry(base_id, self._name_prefix, cfg["type"])
-
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, base_id)},
-            "name": self._name_prefix,
-            "manufacturer": "ISYGLT",
-            "model": cfg["type"],
-        }
+        # Device metadata and its registry entry are resolved once per
+        # device in setup and shared across all of its entities
+        self.device_entry = device_entry
+
+        self._attr_device_info = device_info
 
         if self.device_entry:
             self._attr_device_id = self.device_entry.id
 
         self._base_unique = base_id
-
-        # Device registry auto-creation via _attr_device_info
-        self._available = True
-        self._unsubscribe = async_dispatcher_connect(
-            hass, "isyglt_reg_updated", self.async_schedule_update_ha_state
-        )
+        # Register whose change should re-render this entity; the IO
+        # input subclass points it at CH1
+        self._watch_address = self._address
+        self._last_success = True
+
+    async def async_added_to_hass(self):
+        await super().async_added_to_hass()
+        self.coordinator.register_range(self._address, 1)
+
+    def _reg(self, address: int) -> int | None:
+        """Return a raw register value from the coordinator data."""
+        data = self.coordinator.data
+        if data is None:
+            return None
+        return data.get(address)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        coordinator = self.coordinator
+        success = coordinator.last_update_success
+        if (
+            success
+            and self._last_success
+            and self._watch_address not in coordinator.changed
+        ):
+            return
+        self._last_success = success
+        super()._handle_coordinator_update()
 
     @property
-    def available(self):
-        return self._available
-
-    async def async_will_remove_from_hass(self):
-        if self._unsubscribe:
-            self._unsubscribe()
+    def available(self) -> bool:
+        return self.coordinator.last_update_success and self._reg(self._address) is not None
 
 
 class IsyGltMotionZoneSensor(IsyGltBaseBinarySensor):
     _attr_device_class = BinarySensorDeviceClass.PRESENCE
 
-    def __init__(self, hass, hub_name, cfg, zone: int):
-        super().__init__(hass, hub_name, cfg)
+    def __init__(self, hass, hub_name, cfg, base_id, device_info, device_entry, zone: int):
+        super().__init__(hass, hub_name, cfg, base_id, device_info, device_entry)
         self._zone = zone
-        self._bitmask = MOTION_ZONE_BITS[zone]
+        self._bit_index = zone - 1
         self._attr_name = f"{self._name_prefix} Zone {zone} Presence"
-        self._state = False
         self._attr_unique_id = f"{self._base_unique}_zone{zone}"
 
     @property
     def is_on(self):
-        return self._state
-
-    async def async_update(self):
-        regs = await self.async_read_registers(self._address, 1)
-        if regs is None:
-            self._available = False
-            return
-        self._available = True
-        value = regs[0] & 0xFF
-        self._state = bool(value & self._bitmask)
+        lanes = self.coordinator.bits.get(self._address)
+        return lanes is not None and bool(lanes[self._bit_index])
 
 
 class IsyGltMotionAnySensor(IsyGltBaseBinarySensor):
     _attr_device_class = BinarySensorDeviceClass.PRESENCE
 
-    def __init__(self, hass, hub_name, cfg):
-        super().__init__(hass, hub_name, cfg)
+    def __init__(self, hass, hub_name, cfg, base_id, device_info, device_entry):
+        super().__init__(hass, hub_name, cfg, base_id, device_info, device_entry)
         self._attr_name = f"{self._name_prefix} Presence"
-        self._state = False
         self._attr_unique_id = f"{self._base_unique}_motion"
 
     @property
     def is_on(self):
-        return self._state
-
-    async def async_update(self):
-        regs = await self.async_read_registers(self._address, 1)
-        if regs is None:
-            self._available = False
-            return
-        self._available = True
-        value = regs[0] & 0xFF
-        self._state = value & 0x0F != 0  # any of first 4 bits
+        data = self.coordinator.data
+        if data is None:
+            return False
+        return bool(data.get(self._address, 0) & 0x0F)  # any of first 4 bits
 
 
 class IsyGltButtonSensor(IsyGltBaseBinarySensor):
     """Button press represented as binary sensor (on when pressed)."""
 
-    def __init__(self, hass, hub_name, cfg, button_idx: int):
-        super().__init__(hass, hub_name, cfg)
+    def __init__(self, hass, hub_name, cfg, base_id, device_info, device_entry, button_idx: int):
+        super().__init__(hass, hub_name, cfg, base_id, device_info, device_entry)
         self._button_idx = button_idx
-        self._bitmask = BUTTON_BITS[button_idx]
+        self._bit_index = button_idx - 1
+        self._bitmask = 1 << (button_idx - 1)
         self._attr_name = f"{self._name_prefix} Button {button_idx}"
-        self._state = False
-        self._prev_state = False
         self._attr_unique_id = f"{self._base_unique}_btn{button_idx}"
+        self._event_data: dict | None = None
+
+    async def async_added_to_hass(self):
+        await super().async_added_to_hass()
+        # Payload is static once registered; build it a single time so the
+        # per-poll hot path allocates nothing while idle.
+        self._event_data = {
+            "device_id": self.device_entry.id if self.device_entry else None,
+            "button": self._button_idx,
+            "entity_id": self.entity_id,
+        }
 
     @property
     def is_on(self):
-        return self._state
+        lanes = self.coordinator.bits.get(self._address)
+        return lanes is not None and bool(lanes[self._bit_index])
 
-    async def async_update(self):
-        regs = await self.async_read_registers(self._address, 1)
-        if regs is None:
-            self._available = False
-            return
-        self._available = True
-        value = regs[0] & 0xFF
-        self._state = bool(value & self._bitmask)
-
-        # Emit event on rising edge
-        if self._state and not self._prev_state:
-            dev_id = getattr(self, "device_entry", None)
-            self.hass.bus.async_fire(
-                "isyglt_button_pressed",
-                {
-                    "device_id": dev_id.id if dev_id else None,
-                    "button": self._button_idx,
-                    "entity_id": self.entity_id,
-                },
-            )
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        # Emit event on rising edge (pre-resolved by the coordinator)
+        if self.coordinator.rising.get(self._address, 0) & self._bitmask and self._event_data:
+            self.hass.bus.async_fire("isyglt_button_pressed", self._event_data)
 
-        self._prev_state = self._state
+        super()._handle_coordinator_update()
 
 
 class IsyGltIOInputSensor(IsyGltBaseBinarySensor):
     """Inputs of IO module."""
 
-    def __init__(self, hass, hub_name, cfg, input_idx: int):
-        super().__init__(hass, hub_name, cfg)
+    def __init__(self, hass, hub_name, cfg, base_id, device_info, device_entry, input_idx: int):
+        super().__init__(hass, hub_name, cfg, base_id, device_info, device_entry)
         self._input_idx = input_idx
-        self._bitmask = IO_INPUT_BITS[input_idx]
+        self._bit_index = input_idx - 1
         self._io_input_address = self._address + 1  # Inputs are on CH1 = base +1
+        self._watch_address = self._io_input_address
         self._attr_name = f"{self._name_prefix} Input {input_idx}"
-        self._state = False
         self._attr_unique_id = f"{self._base_unique}_in{input_idx}"
 
+    async def async_added_to_hass(self):
+        await super().async_added_to_hass()
+        self.coordinator.register_range(self._io_input_address, 1)
+
+    @property
+    def available(self) -> bool:
+        return self.coordinator.last_update_success and self._reg(self._io_input_address) is not None
+
     @property
     def is_on(self):
-        return self._state
+        lanes = self.coordinator.bits.get(self._io_input_address)
+        return lanes is not None and bool(lanes[self._bit_index])
 
-    async def async_update(self):
-        regs = await self.async_read_registers(self._io_input_address, 1)
-        if regs is None:
-            self._available = False
-            return
-        self._available = True
-        value = regs[0] & 0xFF
-        self._state = bool(value & self._bitmask) 
\ No newline at end of file
+
+# device type -> (per-index entity class, index count, whole-device extra class)
+_BINARY_BUILD = {
+    DEVICE_TYPE_MOTION_SENSOR: (IsyGltMotionZoneSensor, 4, IsyGltMotionAnySensor),
+    DEVICE_TYPE_IO_MODULE: (IsyGltIOInputSensor, 8, None),
+    DEVICE_TYPE_BUTTON_GRID: (IsyGltButtonSensor, 6, None),
+}
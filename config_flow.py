@@ -1,13 +1,18 @@
+import io
 import logging
+import re
+import uuid
 from typing import Any, Dict, List, Optional
 
 import voluptuous as vol
+import yaml
 from homeassistant import config_entries
 from homeassistant.const import CONF_NAME
 from homeassistant.core import callback, HomeAssistant
 # No longer using cv.yaml_dumper; keep cv import for basic validators
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import selector
+from homeassistant.util import slugify
 
 from .const import (
     DOMAIN,
@@ -20,12 +25,148 @@ from .const import (
     CONF_POLL_INTERVAL,
     CONF_PRESCALER,
     CONF_BIT,
+    DEVICE_TYPE_RGB_LIGHT,
+    DEVICE_TYPE_WHITE_LIGHT,
+    DEVICE_TYPE_MOTION_SENSOR,
+    DEVICE_TYPE_BUTTON_GRID,
+    DEVICE_TYPE_IO_MODULE,
+    DEVICE_TYPE_DIMMER,
+    DEVICE_TYPE_GROUP_SWITCH,
 )
 
 BUS_ADDR_KEY = "bus_addresses"
 
 _LOGGER = logging.getLogger(__name__)
 
+# libyaml-backed loader when available; resolved once per process
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Cheap pre-check that the paste contains an "isyglt:" mapping header at
+# all before handing the full text to the YAML parser.
+_DOMAIN_HEADER_RE = re.compile(rf"^\s*{re.escape(DOMAIN)}\s*:", re.MULTILINE)
+
+# Structure of an imported paste; one compiled schema instead of ad-hoc
+# isinstance checks raising ValueError for control flow.
+_IMPORT_SCHEMA = vol.Schema(
+    {
+        vol.Required(DOMAIN): vol.Schema(
+            {
+                vol.Required(CONF_HUB): vol.All(str, vol.Length(min=1)),
+                vol.Optional(CONF_POLL_INTERVAL, default=1.0): vol.Coerce(float),
+                vol.Optional(CONF_DEVICES, default=list): [dict],
+            },
+            extra=vol.ALLOW_EXTRA,
+        ),
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+# Root options menu; schema compiled once at import instead of per render.
+_INIT_MENU = {
+    "add": "Add device",
+    "edit": "Edit device",
+    "remove": "Remove device",
+    # "generate_script": "Generate ISYGLT script",  # disabled for now
+    "finish": "Save & finish",
+}
+_INIT_SCHEMA = vol.Schema({vol.Required("action"): vol.In(_INIT_MENU)})
+
+# Type labels for the add-device picker; the schema never changes.
+_DEVICE_TYPES = {
+    DEVICE_TYPE_RGB_LIGHT: "RGB DMX Light",
+    DEVICE_TYPE_WHITE_LIGHT: "White Light",
+    DEVICE_TYPE_DIMMER: "Dimmer",
+    DEVICE_TYPE_MOTION_SENSOR: "Motion Sensor",
+    DEVICE_TYPE_BUTTON_GRID: "Button Grid",
+    DEVICE_TYPE_IO_MODULE: "I/O Module",
+    DEVICE_TYPE_GROUP_SWITCH: "Group Switch",
+}
+_ADD_TYPE_SCHEMA = vol.Schema({vol.Required(CONF_TYPE): vol.In(_DEVICE_TYPES)})
+
+# Device types that share the dimmer script template
+_DIMLIKE = frozenset({"dimmer", "white_light", "dmx_rgb"})
+
+# Device types whose detail forms expose the prescaler field
+_PRESCALER_TYPES = frozenset({DEVICE_TYPE_RGB_LIGHT, DEVICE_TYPE_WHITE_LIGHT, DEVICE_TYPE_DIMMER})
+
+# Field validators shared across forms; defined ahead of every schema
+# that references them since the module body runs top to bottom.
+# vol.All chains are immutable, so one instance serves every schema build.
+_POLL_VALIDATOR = vol.All(vol.Coerce(float), vol.Range(min=0.1))
+_POS_INT = cv.positive_int
+_PRESCALER_VALIDATOR = vol.All(vol.Coerce(float), vol.Range(min=0.0001))
+_BIT_VALIDATOR = vol.All(vol.Coerce(int), vol.Range(min=1, max=8))
+
+
+def _details_schema_dict(device_type: str) -> Dict[Any, Any]:
+    """Field dict for a device-type detail form with static defaults."""
+    schema_dict: Dict[Any, Any] = {
+        vol.Required(CONF_NAME): str,
+        vol.Required(CONF_ADDRESS): _POS_INT,
+    }
+    if device_type == DEVICE_TYPE_WHITE_LIGHT:
+        schema_dict[vol.Optional(CONF_CCT_MIN, default=2512)] = _POS_INT
+        schema_dict[vol.Optional(CONF_CCT_MAX, default=5000)] = _POS_INT
+    if device_type == DEVICE_TYPE_GROUP_SWITCH:
+        schema_dict[vol.Required(CONF_BIT)] = _BIT_VALIDATOR
+    if device_type in _PRESCALER_TYPES:
+        schema_dict[vol.Optional(CONF_PRESCALER, default=1)] = _PRESCALER_VALIDATOR
+    return schema_dict
+
+
+# Add-device detail forms only vary by type, so compile each once; the
+# edit form extends these with the current device's values as defaults.
+_ADD_SCHEMAS = {dtype: vol.Schema(_details_schema_dict(dtype)) for dtype in _DEVICE_TYPES}
+
+
+def _white_edit_extra(current: Dict[str, Any]) -> Dict[Any, Any]:
+    return {
+        vol.Optional(CONF_CCT_MIN, default=current.get(CONF_CCT_MIN, 2512)): _POS_INT,
+        vol.Optional(CONF_CCT_MAX, default=current.get(CONF_CCT_MAX, 5000)): _POS_INT,
+    }
+
+
+def _group_edit_extra(current: Dict[str, Any]) -> Dict[Any, Any]:
+    return {vol.Required(CONF_BIT, default=current.get(CONF_BIT, 1)): _BIT_VALIDATOR}
+
+
+def _prescaler_edit_extra(current: Dict[str, Any]) -> Dict[Any, Any]:
+    return {vol.Optional(CONF_PRESCALER, default=current.get(CONF_PRESCALER, 1)): _PRESCALER_VALIDATOR}
+
+
+# Extra edit-form fields per device type, resolved with one dict lookup
+# instead of a chain of type comparisons per render.
+_EDIT_EXTRAS: Dict[str, tuple] = {dtype: () for dtype in _DEVICE_TYPES}
+_EDIT_EXTRAS[DEVICE_TYPE_WHITE_LIGHT] = (_white_edit_extra,)
+_EDIT_EXTRAS[DEVICE_TYPE_GROUP_SWITCH] = (_group_edit_extra,)
+for _dtype in _PRESCALER_TYPES:
+    _EDIT_EXTRAS[_dtype] = _EDIT_EXTRAS[_dtype] + (_prescaler_edit_extra,)
+
+# Static forms, compiled once at import
+_MANUAL_SCHEMA = vol.Schema({
+    vol.Required(CONF_HUB): str,
+    vol.Optional(CONF_POLL_INTERVAL, default=1.0): _POLL_VALIDATOR,
+})
+_PARAMS_SCHEMA = vol.Schema({
+    vol.Optional("dim_start_ne", default=30): _POS_INT,
+    vol.Optional("autooff_seconds", default=1): _POS_INT,
+})
+
+# Per-bit line templates for the button-grid script section; bound to
+# .format once per grid instead of evaluating an f-string per bit.
+_AUTOOFF_FMT = "AUTOOFF NE{ne}.{bit} {autooff}s\n".format
+_HFLANKE_FMT = "HFLANKE M{bus}.{bit} E{bus}.{bit}\n".format
+_SET_FMT = "SET NE{ne}.{bit} M{bus}.{bit}\n".format
+_KOPIE_FMT = "KOPIE A{bus}.{bit} NE{ne}.{bit}\n".format
+
+# Selectors are immutable; one multiline text selector serves every form.
+_MULTILINE_TEXT_SEL = selector.TextSelector(selector.TextSelectorConfig(multiline=True))
+
+_YAML_SAMPLE = (
+    f"{DOMAIN}:\n  {CONF_HUB}: MyHub\n  {CONF_POLL_INTERVAL}: 1.0\n  {CONF_DEVICES}:\n"
+    f"    - {CONF_TYPE}: dmx_rgb\n      {CONF_NAME}: Living Room\n      {CONF_ADDRESS}: 10\n"
+)
+
 
 class IsyGltConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
@@ -54,35 +195,25 @@ class IsyGltConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             return self.async_create_entry(title=user_input[CONF_HUB], data=user_input)
 
-        schema = vol.Schema({
-            vol.Required(CONF_HUB): str,
-            vol.Optional(CONF_POLL_INTERVAL, default=1.0): vol.All(vol.Coerce(float), vol.Range(min=0.1)),
-        })
-        return self.async_show_form(step_id="manual", data_schema=schema, errors=errors)
+        return self.async_show_form(step_id="manual", data_schema=_MANUAL_SCHEMA, errors=errors)
 
     # -------- YAML IMPORT FLOW --------
     async def async_step_import_yaml(self, user_input: Dict[str, Any] | None = None):
         """Paste YAML configuration to import."""
-        import yaml
-
         if user_input is not None:
             raw_yaml = user_input.get("yaml_config", "")
             try:
-                data = yaml.safe_load(raw_yaml) or {}
-                if not isinstance(data, dict) or DOMAIN not in data:
+                if not _DOMAIN_HEADER_RE.search(raw_yaml):
                     raise ValueError("root_missing")
-
-                cfg = data[DOMAIN]
-                hub = cfg.get(CONF_HUB)
-                devices = cfg.get(CONF_DEVICES, [])
-                poll = cfg.get(CONF_POLL_INTERVAL, 1.0)
-
-                if not hub or not isinstance(hub, str):
-                    raise ValueError("hub")
-
-                # Validate devices list minimal structure; skip deep validation here
-                if not isinstance(devices, list):
-                    raise ValueError("devices")
+                # Parse off the event loop; libyaml releases the GIL so a
+                # large paste does not stall other coroutines.
+                data = await self.hass.async_add_executor_job(
+                    yaml.load, raw_yaml, _YAML_LOADER
+                ) or {}
+                cfg = _IMPORT_SCHEMA(data)[DOMAIN]
+                hub = cfg[CONF_HUB]
+                devices = cfg[CONF_DEVICES]
+                poll = cfg[CONF_POLL_INTERVAL]
 
                 # Create entry with hub & poll interval; devices stored into options
                 entry = self.async_create_entry(
@@ -93,18 +224,13 @@ class IsyGltConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 return entry
             except Exception as exc:
                 _LOGGER.debug("YAML import failed: %s", exc)
-                text_sel = selector.TextSelector(selector.TextSelectorConfig(multiline=True))
                 return self.async_show_form(
                     step_id="import_yaml",
-                    data_schema=vol.Schema({vol.Required("yaml_config", default=raw_yaml): text_sel}),
+                    data_schema=vol.Schema({vol.Required("yaml_config", default=raw_yaml): _MULTILINE_TEXT_SEL}),
                     errors={"base": "invalid_yaml"},
                 )
 
-        sample = (
-            f"{DOMAIN}:\n  {CONF_HUB}: MyHub\n  {CONF_POLL_INTERVAL}: 1.0\n  {CONF_DEVICES}:\n    - {CONF_TYPE}: dmx_rgb\n      {CONF_NAME}: Living Room\n      {CONF_ADDRESS}: 10\n"
-        )
-        text_sel = selector.TextSelector(selector.TextSelectorConfig(multiline=True))
-        schema = vol.Schema({vol.Required("yaml_config", default=sample): text_sel})
+        schema = vol.Schema({vol.Required("yaml_config", default=_YAML_SAMPLE): _MULTILINE_TEXT_SEL})
         return self.async_show_form(step_id="import_yaml", data_schema=schema)
 
     async def async_step_import(self, import_data: Dict[str, Any]):
@@ -123,15 +249,39 @@ class IsyGltOptionsFlow(config_entries.OptionsFlow):
         self.config_entry = config_entry
         # Retrieve existing devices; prefer options, fall back to entry data (for legacy entries)
         if CONF_DEVICES in config_entry.options:
-            self.devices = list(config_entry.options[CONF_DEVICES])  # type: ignore[arg-type]
+            stored = config_entry.options[CONF_DEVICES]
         else:
-            self.devices = list(config_entry.data.get(CONF_DEVICES, []))  # type: ignore[arg-type]
-        self._device_index: Optional[int] = None  # index of device being edited/removed
+            stored = config_entry.data.get(CONF_DEVICES, [])
+        # Keyed working copy is built lazily on first access; a user who
+        # just opens the menu and hits finish never pays for it.
+        self._devices_src: List[Dict[str, Any]] = stored
+        self._devices_owned: Optional[Dict[str, Dict[str, Any]]] = None
+        self._device_index: Optional[str] = None  # key of device being edited/removed
         self._device_type: Optional[str] = None   # type selected when adding device
+        # Memoized _device_key results, keyed by device dict identity;
+        # cleared whenever the devices list is mutated.
+        self._key_cache: Dict[int, str] = {}
+        # Device-picker labels shared by the edit and remove steps;
+        # invalidated together with the key cache.
+        self._choices_cache: Optional[Dict[str, str]] = None
+        # Bus-address form schemas keyed by their (key, default) signature
+        self._bus_form_cache: Dict[tuple, vol.Schema] = {}
 
         # Cached bus addresses for script generation
         self.bus_addrs: Dict[str, int] = dict(config_entry.options.get(BUS_ADDR_KEY, {}))
 
+    @property
+    def devices(self) -> Dict[str, Dict[str, Any]]:
+        """Working device set keyed by a stable opaque id.
+
+        Built from the stored list on first access; entries are saved
+        back as a plain list, so stored config is keyed at most once per
+        flow.
+        """
+        if self._devices_owned is None:
+            self._devices_owned = {uuid.uuid4().hex: d for d in self._devices_src}
+        return self._devices_owned
+
     # -------------- MENU / ROOT STEP --------------
     async def async_step_init(self, user_input: Dict[str, Any] | None = None):
         """Initial step: show main menu for managing devices."""
@@ -150,7 +300,10 @@ class IsyGltOptionsFlow(config_entries.OptionsFlow):
                 return await self.async_step_remove_select_device()
             # 'generate_script' temporarily disabled
             # finish -> save and exit
-            return self.async_create_entry(title="Devices", data={CONF_DEVICES: self.devices})
+            if self._devices_owned is None:
+                # untouched; save the source list as-is without keying it
+                return self.async_create_entry(title="Devices", data={CONF_DEVICES: list(self._devices_src)})
+            return self.async_create_entry(title="Devices", data={CONF_DEVICES: list(self._devices_owned.values())})
 
         return await self._show_init_form()
 
@@ -159,70 +312,27 @@ class IsyGltOptionsFlow(config_entries.OptionsFlow):
         if errors is None:
             errors = {}
 
-        menu = {
-            "add": "Add device",
-            "edit": "Edit device",
-            "remove": "Remove device",
-            # "generate_script": "Generate ISYGLT script",  # disabled for now
-            "finish": "Save & finish",
-        }
-        schema = vol.Schema({vol.Required("action"): vol.In(menu)})
-        return self.async_show_form(step_id="init", data_schema=schema, errors=errors)
+        return self.async_show_form(step_id="init", data_schema=_INIT_SCHEMA, errors=errors)
 
     # -------------- ADD DEVICE FLOW --------------
     async def async_step_add_select_type(self, user_input: Dict[str, Any] | None = None):
         """Step to select the type of device to add."""
-        from .const import (
-            DEVICE_TYPE_RGB_LIGHT,
-            DEVICE_TYPE_WHITE_LIGHT,
-            DEVICE_TYPE_MOTION_SENSOR,
-            DEVICE_TYPE_BUTTON_GRID,
-            DEVICE_TYPE_IO_MODULE,
-            DEVICE_TYPE_DIMMER,
-            DEVICE_TYPE_GROUP_SWITCH,
-        )
-
-        types = {
-            DEVICE_TYPE_RGB_LIGHT: "RGB DMX Light",
-            DEVICE_TYPE_WHITE_LIGHT: "White Light",
-            DEVICE_TYPE_DIMMER: "Dimmer",
-            DEVICE_TYPE_MOTION_SENSOR: "Motion Sensor",
-            DEVICE_TYPE_BUTTON_GRID: "Button Grid",
-            DEVICE_TYPE_IO_MODULE: "I/O Module",
-            DEVICE_TYPE_GROUP_SWITCH: "Group Switch",
-        }
-
         if user_input is not None:
             self._device_type = user_input[CONF_TYPE]
             return await self.async_step_add_device_details()
 
-        schema = vol.Schema({vol.Required(CONF_TYPE): vol.In(types)})
-        return self.async_show_form(step_id="add_select_type", data_schema=schema)
+        return self.async_show_form(step_id="add_select_type", data_schema=_ADD_TYPE_SCHEMA)
 
     async def async_step_add_device_details(self, user_input: Dict[str, Any] | None = None):
         """Collect details for the new device based on the selected type."""
         assert self._device_type is not None  # mypy
 
-        schema_dict = {
-            vol.Required(CONF_NAME): str,
-            vol.Required(CONF_ADDRESS): cv.positive_int,
-        }
-
-        if self._device_type == "white_light":
-            schema_dict[vol.Optional(CONF_CCT_MIN, default=2512)] = cv.positive_int
-            schema_dict[vol.Optional(CONF_CCT_MAX, default=5000)] = cv.positive_int
-        if self._device_type == "group_switch":
-            schema_dict[vol.Required(CONF_BIT)] = vol.All(vol.Coerce(int), vol.Range(min=1, max=8))
-
-        # optional prescaler for some types
-        if self._device_type in {"dmx_rgb", "white_light", "dimmer"}:
-            schema_dict[vol.Optional(CONF_PRESCALER, default=1)] = vol.All(vol.Coerce(float), vol.Range(min=0.0001))
-
-        schema = vol.Schema(schema_dict)
+        schema = _ADD_SCHEMAS[self._device_type]
 
         if user_input is not None:
             device = {CONF_TYPE: self._device_type, **user_input}
-            self.devices.append(device)
+            self.devices[uuid.uuid4().hex] = device
+            self._choices_cache = None
             _LOGGER.debug("Added device %s", device)
             # Reset temp vars
             self._device_type = None
@@ -230,16 +340,25 @@ class IsyGltOptionsFlow(config_entries.OptionsFlow):
 
         return self.async_show_form(step_id="add_device_details", data_schema=schema)
 
+    def _get_choices(self) -> Dict[str, str]:
+        """Index -> label mapping for the device picker forms."""
+        if self._choices_cache is None:
+            self._choices_cache = {
+                key: f"{d.get(CONF_NAME, 'Unnamed')} ({d[CONF_TYPE]} @ {d[CONF_ADDRESS]})"
+                for key, d in self.devices.items()
+            }
+        return self._choices_cache
+
     # -------------- EDIT DEVICE FLOW --------------
     async def async_step_edit_select_device(self, user_input: Dict[str, Any] | None = None):
         """Choose which device to edit."""
         if not self.devices:
             return await self.async_step_init()
 
-        choices = {str(idx): f"{d.get(CONF_NAME, 'Unnamed')} ({d[CONF_TYPE]} @ {d[CONF_ADDRESS]})" for idx, d in enumerate(self.devices)}
+        choices = self._get_choices()
 
         if user_input is not None:
-            self._device_index = int(user_input["idx"])
+            self._device_index = user_input["idx"]
             # Pre-select type and move to edit details
             self._device_type = self.devices[self._device_index][CONF_TYPE]
             return await self.async_step_edit_device_details()
@@ -254,25 +373,23 @@ class IsyGltOptionsFlow(config_entries.OptionsFlow):
 
         current = self.devices[self._device_index]
 
-        schema_dict = {
+        overrides = {
             vol.Required(CONF_NAME, default=current.get(CONF_NAME, "")): str,
-            vol.Required(CONF_ADDRESS, default=current.get(CONF_ADDRESS, 0)): cv.positive_int,
+            vol.Required(CONF_ADDRESS, default=current.get(CONF_ADDRESS, 0)): _POS_INT,
         }
+        for extra in _EDIT_EXTRAS.get(current[CONF_TYPE], ()):
+            overrides.update(extra(current))
 
-        if current[CONF_TYPE] == "white_light":
-            schema_dict[vol.Optional(CONF_CCT_MIN, default=current.get(CONF_CCT_MIN, 2512))] = cv.positive_int
-            schema_dict[vol.Optional(CONF_CCT_MAX, default=current.get(CONF_CCT_MAX, 5000))] = cv.positive_int
-        if current[CONF_TYPE] == "group_switch":
-            schema_dict[vol.Required(CONF_BIT, default=current.get(CONF_BIT, 1))] = vol.All(vol.Coerce(int), vol.Range(min=1, max=8))
-        if current[CONF_TYPE] in {"dmx_rgb", "white_light", "dimmer"}:
-            schema_dict[vol.Optional(CONF_PRESCALER, default=current.get(CONF_PRESCALER, 1))] = vol.All(vol.Coerce(float), vol.Range(min=0.0001))
-
-        schema = vol.Schema(schema_dict)
+        # Re-default the precompiled per-type schema rather than building
+        # a fresh field dict from scratch.
+        schema = _ADD_SCHEMAS[current[CONF_TYPE]].extend(overrides)
 
         if user_input is not None:
             # Replace existing device definition
             new_device = {CONF_TYPE: current[CONF_TYPE], **user_input}
             self.devices[self._device_index] = new_device
+            self._key_cache.clear()
+            self._choices_cache = None
             _LOGGER.debug("Updated device idx %s to %s", self._device_index, new_device)
             self._device_index = None
             return await self.async_step_init()
@@ -285,11 +402,12 @@ class IsyGltOptionsFlow(config_entries.OptionsFlow):
         if not self.devices:
             return await self.async_step_init()
 
-        choices = {str(idx): f"{d.get(CONF_NAME, 'Unnamed')} ({d[CONF_TYPE]} @ {d[CONF_ADDRESS]})" for idx, d in enumerate(self.devices)}
+        choices = self._get_choices()
 
         if user_input is not None:
-            idx = int(user_input["idx"])
-            removed = self.devices.pop(idx)
+            removed = self.devices.pop(user_input["idx"])
+            self._key_cache.clear()
+            self._choices_cache = None
             _LOGGER.debug("Removed device %s", removed)
             return await self.async_step_init()
 
@@ -303,22 +421,27 @@ class IsyGltOptionsFlow(config_entries.OptionsFlow):
 
         # First ensure all bus addresses collected
         missing_keys = []
-        for dev in self.devices:
+        for dev in self.devices.values():
             key = self._device_key(dev)
             if key not in self.bus_addrs:
                 missing_keys.append(key)
 
         if missing_keys and user_input is None:
-            # present bus address form
-            fields = {}
-            for dev in self.devices:
-                key = self._device_key(dev)
-                default = self.bus_addrs.get(key, dev.get(CONF_ADDRESS, 0))
-                label = f"{dev.get(CONF_NAME, dev[CONF_TYPE])} (type {dev[CONF_TYPE]}, addr {dev[CONF_ADDRESS]})"
-                fields[vol.Required(key, description={"suggested_value": default})] = cv.positive_int
-
-            fields[vol.Optional("save", default=True)] = bool
-            schema = vol.Schema(fields)
+            # present bus address form; identical (key, default) pairs
+            # re-render the same compiled schema from the cache
+            pairs = tuple(
+                (key, self.bus_addrs.get(key, dev.get(CONF_ADDRESS, 0)))
+                for dev in self.devices.values()
+                for key in (self._device_key(dev),)
+            )
+            schema = self._bus_form_cache.get(pairs)
+            if schema is None:
+                fields = {
+                    vol.Required(key, description={"suggested_value": default}): _POS_INT
+                    for key, default in pairs
+                }
+                fields[vol.Optional("save", default=True)] = bool
+                schema = self._bus_form_cache[pairs] = vol.Schema(fields)
             return self.async_show_form(step_id="generate_script", data_schema=schema)
 
         if missing_keys and user_input is not None:
@@ -332,20 +455,12 @@ class IsyGltOptionsFlow(config_entries.OptionsFlow):
                 self.hass.config_entries.async_update_entry(self.config_entry, options=new_options)  # type: ignore[attr-defined]
 
             # After updating addresses, ask for params
-            params_schema = vol.Schema({
-                vol.Optional("dim_start_ne", default=30): cv.positive_int,
-                vol.Optional("autooff_seconds", default=1): cv.positive_int,
-            })
-            return self.async_show_form(step_id="generate_script_params", data_schema=params_schema)
+            return self.async_show_form(step_id="generate_script_params", data_schema=_PARAMS_SCHEMA)
 
         # If we arrive here without missing addresses, check which step
         if user_input is None:
             # All addresses present, ask for params
-            params_schema = vol.Schema({
-                vol.Optional("dim_start_ne", default=30): cv.positive_int,
-                vol.Optional("autooff_seconds", default=1): cv.positive_int,
-            })
-            return self.async_show_form(step_id="generate_script_params", data_schema=params_schema)
+            return self.async_show_form(step_id="generate_script_params", data_schema=_PARAMS_SCHEMA)
 
         # user_input from params step
         return await self._generate_script_show(user_input)
@@ -358,94 +473,105 @@ class IsyGltOptionsFlow(config_entries.OptionsFlow):
 
     def _device_key(self, dev: Dict[str, Any]) -> str:
         """Return unique key for device for bus address cache."""
-        from homeassistant.util import slugify
-        return slugify(f"{dev.get(CONF_NAME, '')}_{dev[CONF_TYPE]}_{dev[CONF_ADDRESS]}")
+        key = self._key_cache.get(id(dev))
+        if key is None:
+            key = slugify(f"{dev.get(CONF_NAME, '')}_{dev[CONF_TYPE]}_{dev[CONF_ADDRESS]}")
+            self._key_cache[id(dev)] = key
+        return key
 
     async def _generate_script_show(self, params: Dict[str, Any]):
         """Generate script and show."""
         dim_start_ne: int = params.get("dim_start_ne", 30)
         autooff: int = params.get("autooff_seconds", 1)
 
-        script_lines: list[str] = []
+        # Write fragments straight into a string buffer; appending to a
+        # list and joining at the end doubles the peak allocations.
+        buf = io.StringIO()
+        w = buf.write
+
+        # Bucket devices by section in one pass instead of filtering the
+        # full list once per section.
+        bwm_devices: list[Dict[str, Any]] = []
+        dim_devices: list[Dict[str, Any]] = []
+        grid_devices: list[Dict[str, Any]] = []
+        for d in self.devices.values():
+            dtype = d[CONF_TYPE]
+            if dtype == "motion_sensor":
+                bwm_devices.append(d)
+            elif dtype in _DIMLIKE:
+                dim_devices.append(d)
+            elif dtype == "button_grid":
+                grid_devices.append(d)
 
         # ---- Motion sensors ----
-        bwm_devices = [d for d in self.devices if d[CONF_TYPE] == "motion_sensor"]
         bwm_devices.sort(key=lambda d: d[CONF_ADDRESS])
 
-        for dev in bwm_devices:
-            addr_bus = self.bus_addrs[self._device_key(dev)]
+        # Resolve each device's bus address once up front; the loop body
+        # only consumes the pre-paired values.
+        for dev, addr_bus in [(d, self.bus_addrs[self._device_key(d)]) for d in bwm_devices]:
             channel = addr_bus  # channel equals bus address for BWM
 
-            script_lines.append(f"; BWM {addr_bus}  ->  NE{channel}\n")
-            script_lines.append(f"TRF NE{channel} = E{addr_bus}.1, E{addr_bus}.2, E{addr_bus}.3, E{addr_bus}.4\n\n")
-            script_lines.append(f"KOPIE A{addr_bus}.1 = NE{channel}.8\n\n")
-            script_lines.append(f"TRFAD NE{channel+1} AE{addr_bus}.1 1\n")
-            script_lines.append(f"TRFAD NE{channel+2} AE{addr_bus}.2 1\n\n")
-
-        if bwm_devices:
-            script_lines.append("\n")
+            w(f"; BWM {addr_bus}  ->  NE{channel}\n")
+            w(f"TRF NE{channel} = E{addr_bus}.1, E{addr_bus}.2, E{addr_bus}.3, E{addr_bus}.4\n\n")
+            w(f"KOPIE A{addr_bus}.1 = NE{channel}.8\n\n")
+            w(f"TRFAD NE{channel+1} AE{addr_bus}.1 1\n")
+            w(f"TRFAD NE{channel+2} AE{addr_bus}.2 1\n\n")
 
         # ---- Dimmers / white lights / rgb ----
-        dim_devices = [d for d in self.devices if d[CONF_TYPE] in ("dimmer", "white_light", "dmx_rgb")]
         dim_devices.sort(key=lambda d: d[CONF_ADDRESS])
+        dim_resolved = [(d, self.bus_addrs[self._device_key(d)]) for d in dim_devices]
+
+        # Separate sections only when there is earlier content; trailing
+        # separators are never written, so no final strip pass is needed.
+        if buf.tell() and dim_resolved:
+            w("\n")
 
         channel = dim_start_ne
-        for idx, dev in enumerate(dim_devices, start=1):
-            addr_bus = self.bus_addrs[self._device_key(dev)]
+        for idx, (dev, addr_bus) in enumerate(dim_resolved, start=1):
             name = dev.get(CONF_NAME, f"Dimmer {idx}")
 
             base_ch = channel
             dim_ch = channel + 1
 
-            script_lines.append(f"; {name}\n; DIM {idx}\n\n")
+            w(f"; {name}\n; DIM {idx}\n\n")
 
-            script_lines.append(f"TRFDA AA{addr_bus}.1 NE{dim_ch} 2s NE{base_ch}.1\n")
-            script_lines.append(f"TRFDA AA{addr_bus}.1 %0 2s !NE{base_ch}.1\n")
-            script_lines.append(f"TRFB NE{dim_ch} %100 !NE{base_ch}.2\n\n\n")
+            w(f"TRFDA AA{addr_bus}.1 NE{dim_ch} 2s NE{base_ch}.1\n")
+            w(f"TRFDA AA{addr_bus}.1 %0 2s !NE{base_ch}.1\n")
+            w(f"TRFB NE{dim_ch} %100 !NE{base_ch}.2\n\n\n")
 
-            script_lines.append(f"; {name} (Channel 2)\n; DIM {idx}\n\n")
-            script_lines.append(f"TRFDA AA{addr_bus}.2 NE{dim_ch+2} 2s NE{base_ch+2}.1\n")
-            script_lines.append(f"TRFDA AA{addr_bus}.2 %0 2s !NE{base_ch+2}.1\n")
-            script_lines.append(f"TRFB NE{dim_ch+2} %100 !NE{base_ch+2}.2\n")
+            w(f"; {name} (Channel 2)\n; DIM {idx}\n\n")
+            w(f"TRFDA AA{addr_bus}.2 NE{dim_ch+2} 2s NE{base_ch+2}.1\n")
+            w(f"TRFDA AA{addr_bus}.2 %0 2s !NE{base_ch+2}.1\n")
+            w(f"TRFB NE{dim_ch+2} %100 !NE{base_ch+2}.2\n")
 
             channel += 4
 
-        if dim_devices:
-            script_lines.append("\n")
-
         # ---- Button grids ----
-        grid_devices = [d for d in self.devices if d[CONF_TYPE] == "button_grid"]
         grid_devices.sort(key=lambda d: d[CONF_ADDRESS])
 
-        for dev in grid_devices:
-            addr_bus = self.bus_addrs[self._device_key(dev)]
+        for dev, addr_bus in [(d, self.bus_addrs[self._device_key(d)]) for d in grid_devices]:
             ne_addr = addr_bus
 
-            script_lines.append(f"; SW {addr_bus}  -> NE{ne_addr}\n\n")
-            script_lines.append("; BUTTONS\n\n")
-            script_lines.append(f"; turn bits off again after {autooff}s, give modbus enough time to read them\n")
-            for bit in range(1, 7):
-                script_lines.append(f"AUTOOFF NE{ne_addr}.{bit} {autooff}s\n")
-            script_lines.append("\n; rising edge detection\n")
-            for bit in range(1, 7):
-                script_lines.append(f"HFLANKE M{addr_bus}.{bit} E{addr_bus}.{bit}\n")
-            script_lines.append("\n; set bit on on press\n")
-            for bit in range(1, 7):
-                script_lines.append(f"SET NE{ne_addr}.{bit} M{addr_bus}.{bit}\n")
+            if buf.tell():
+                w("\n")
+            w(f"; SW {addr_bus}  -> NE{ne_addr}\n\n")
+            w("; BUTTONS\n\n")
+            w(f"; turn bits off again after {autooff}s, give modbus enough time to read them\n")
+            buf.writelines(_AUTOOFF_FMT(ne=ne_addr, bit=bit, autooff=autooff) for bit in range(1, 7))
+            w("\n; rising edge detection\n")
+            buf.writelines(_HFLANKE_FMT(bus=addr_bus, bit=bit) for bit in range(1, 7))
+            w("\n; set bit on on press\n")
+            buf.writelines(_SET_FMT(ne=ne_addr, bus=addr_bus, bit=bit) for bit in range(1, 7))
 
             led_ne = ne_addr + 1
-            script_lines.append("\n; LEDs\n")
-            for bit in range(1, 8):
-                script_lines.append(f"KOPIE A{addr_bus}.{bit} NE{led_ne}.{bit}\n")
-
-            script_lines.append("\n")
+            w("\n; LEDs\n")
+            buf.writelines(_KOPIE_FMT(bus=addr_bus, ne=led_ne, bit=bit) for bit in range(1, 8))
 
-        full_script = "\n".join(script_lines).strip()
+        full_script = buf.getvalue()
 
-        text_sel = selector.TextSelector(selector.TextSelectorConfig(multiline=True))
         return self.async_show_form(
             step_id="generate_script_result",
-            data_schema=vol.Schema({vol.Optional("script", default=full_script): text_sel}),
+            data_schema=vol.Schema({vol.Optional("script", default=full_script): _MULTILINE_TEXT_SEL}),
             description_placeholders={"note": "Copy the generated code and paste it into ISYGLT"},
         ) 
 
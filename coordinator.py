@@ -0,0 +1,152 @@
+"""Shared per-hub data update coordinator for ISYGLT entities."""
+import asyncio
+import logging
+from datetime import timedelta
+from functools import lru_cache
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .const import DOMAIN
+from .helpers import IsyGltModbusMixin
+
+_LOGGER = logging.getLogger(__name__)
+
+BLOCK_LIMIT = 125  # FC03 register limit per read
+GAP_THRESHOLD = 16  # registers; if gap larger, start new range
+
+
+def _coalesce_spans(spans: list) -> list:
+    """Merge sorted (start, end) spans into (start, length) bulk-read ranges.
+
+    Single pass after one C-level sort; merged ranges never exceed
+    BLOCK_LIMIT registers and gaps wider than GAP_THRESHOLD start a new
+    range.
+    """
+    if not spans:
+        return []
+    spans.sort()
+    ranges: list = []
+    cur_start, cur_end = spans[0]
+    for s, e in spans[1:]:
+        new_end = max(cur_end, e)
+        if s - cur_end - 1 <= GAP_THRESHOLD and new_end - cur_start + 1 <= BLOCK_LIMIT:
+            cur_end = new_end
+        else:
+            ranges.append((cur_start, cur_end - cur_start + 1))
+            cur_start, cur_end = s, e
+    ranges.append((cur_start, cur_end - cur_start + 1))
+    return ranges
+
+
+@lru_cache(maxsize=256)
+def _lanes(byte: int) -> tuple:
+    """Bit lanes of a byte, LSB first.
+
+    Only 256 byte values exist, so every lane tuple is computed once for
+    the process lifetime; publishing a register to its eight bit-entities
+    is then a dict store of a shared tuple.
+    """
+    return tuple((byte >> i) & 1 for i in range(8))
+
+
+class _HubReader(IsyGltModbusMixin):
+    """Bare mixin instance the coordinator uses for bulk reads."""
+
+
+class IsyGltCoordinator(DataUpdateCoordinator):
+    """Coordinator that bulk-reads a hub's merged register ranges.
+
+    ``data`` maps register address -> raw value; all ISYGLT entities on
+    the hub derive their state from this shared map instead of issuing
+    individual Modbus reads.
+    """
+
+    def __init__(self, hass: HomeAssistant, hub_name: str, poll_interval: float):
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN} {hub_name}",
+            update_interval=timedelta(seconds=poll_interval),
+        )
+        self.hub_name = hub_name
+        self._reader = _HubReader(hass, hub_name)
+        # address -> bits that went 0->1 in the latest frame
+        self.rising: dict[int, int] = {}
+        # address -> low-byte bit lanes; single-bit entities index this
+        # instead of re-masking the raw value per poll
+        self.bits: dict[int, tuple] = {}
+        # addresses whose value differs from the previous frame; entities
+        # use this to skip state writes for untouched registers
+        self.changed: set = set()
+
+    def register_range(self, start: int, count: int) -> None:
+        """Record a register span an entity depends on.
+
+        The device-table seed covers the common layouts; entities call
+        this with their exact needs so the merged bulk ranges track what
+        is actually decoded rather than per-type guesses.
+        """
+        ranges_map = self.hass.data[DOMAIN].setdefault("bulk_range", {})
+        current = ranges_map.get(self.hub_name, [])
+        spans = [(s, s + length - 1) for s, length in current]
+        spans.append((start, start + count - 1))
+        ranges_map[self.hub_name] = _coalesce_spans(spans)
+
+    async def _async_update_data(self):
+        ranges = self.hass.data.get(DOMAIN, {}).get("bulk_range", {}).get(self.hub_name, [])
+        data: dict[int, int] = dict(self.data) if self.data else {}
+        failed = 0
+        # Enqueue every range at once instead of awaiting them one by
+        # one: the write queue's fusing can then merge nearby ranges
+        # into fewer bus transactions, and the cycle pays queue latency
+        # once rather than per range. The HA modbus hub still serializes
+        # the actual wire I/O, which also keeps RTU half-duplex safe.
+        results = await asyncio.gather(
+            *(self._reader.async_read_registers(start, length) for start, length in ranges),
+            return_exceptions=True,
+        )
+        for (start, length), regs in zip(ranges, results):
+            if regs is None or isinstance(regs, BaseException):
+                if isinstance(regs, BaseException):
+                    _LOGGER.debug("bulk read %s+%s failed: %s", start, length, regs)
+                failed += 1
+                continue
+            for off, val in enumerate(regs):
+                data[start + off] = val
+        if ranges and failed == len(ranges):
+            raise UpdateFailed(f"all bulk reads failed for hub {self.hub_name}")
+        # One XOR per register resolves all rising edges of the frame;
+        # button entities only test their bit against this mask.
+        prev = self.data or {}
+        self.rising = {addr: val & ~prev.get(addr, val) for addr, val in data.items()}
+        self.bits = {addr: _lanes(val & 0xFF) for addr, val in data.items()}
+        self.changed = {addr for addr, val in data.items() if prev.get(addr) != val}
+        return data
+
+    def changed_in(self, start: int, end: int) -> bool:
+        """Whether any register in [start, end] changed in the last frame."""
+        changed = self.changed
+        if not changed:
+            return False
+        return any(addr in changed for addr in range(start, end + 1))
+
+    def mirror_write(self, address: int, value: int) -> None:
+        """Fold a just-written byte into the shared image and lane table."""
+        if self.data is not None:
+            self.data[address] = value
+        self.bits[address] = _lanes(value & 0xFF)
+
+
+def async_get_coordinator(hass: HomeAssistant, hub_name: str, poll_interval: float) -> IsyGltCoordinator:
+    """Create (once per hub) and return the shared coordinator."""
+    coordinators = hass.data.setdefault(DOMAIN, {}).setdefault("coordinator", {})
+    coordinator = coordinators.get(hub_name)
+    if coordinator is None:
+        coordinator = IsyGltCoordinator(hass, hub_name, poll_interval)
+        coordinators[hub_name] = coordinator
+    else:
+        # Pick up interval changes on reload without recreating the
+        # coordinator (and without an HA restart).
+        coordinator.update_interval = timedelta(seconds=poll_interval)
+    return coordinator
@@ -1,8 +1,9 @@
 import logging
 from typing import List
 
+from homeassistant.const import CONF_NAME
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.util import slugify
 
 from .const import DOMAIN
 
@@ -14,77 +15,247 @@ from homeassistant.components.modbus.const import (
 from homeassistant.helpers import entity_registry as er
 
 import asyncio
-import time
-from dataclasses import dataclass, field
+from array import array
+from bisect import bisect_right, insort
+from collections import deque
+from dataclasses import dataclass
 from typing import List, Any
 
 _LOGGER = logging.getLogger(__name__)
 
+
+def ensure_device_entry(hass: HomeAssistant, hub_name: str, base_id: str, name: str, model: str):
+    """Create or fetch the device registry entry for one configured device."""
+    from homeassistant.helpers import device_registry as dr
+
+    dev_reg = dr.async_get(hass)
+
+    # 1. prefer an isyglt config-entry that matches this hub
+    ceid = None
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        if entry.title == hub_name:
+            ceid = entry.entry_id
+            break
+    if ceid is None:
+        # 2. fallback: first isyglt entry
+        entries = hass.config_entries.async_entries(DOMAIN)
+        if entries:
+            ceid = entries[0].entry_id
+        else:
+            # 3. last resort: create a new dummy entry so we never fall back to Sun
+            ceid = hass.config_entries.async_create(
+                domain=DOMAIN,
+                title=hub_name,
+                data={},
+            ).entry_id
+
+    return dev_reg.async_get_or_create(
+        config_entry_id=ceid,
+        identifiers={(DOMAIN, base_id)},
+        manufacturer="ISYGLT",
+        name=name,
+        model=model,
+    )
+
+
+def build_device_meta(hass: HomeAssistant, hub_name: str, cfg: dict) -> tuple:
+    """Return (base_id, device_info, device_entry) for one configured device.
+
+    Platforms call this once per device dict and hand the results to
+    every entity the device spawns, so a 7-entity button grid shares a
+    single slugify call, one device_info dict and one device-registry
+    round trip instead of redoing them per entity.
+    """
+    base_id = f"{hub_name}_{slugify(cfg[CONF_NAME])}_{cfg['type']}"
+    device_info = {
+        "identifiers": {(DOMAIN, base_id)},
+        "name": cfg[CONF_NAME],
+        "manufacturer": "ISYGLT",
+        "model": cfg["type"],
+    }
+    device_entry = ensure_device_entry(hass, hub_name, base_id, cfg[CONF_NAME], cfg["type"])
+    return base_id, device_info, device_entry
+
+
 # ---------------- Priority Modbus Queue -----------------
 
 
-@dataclass(order=True)
+@dataclass(slots=True)
 class HubCommand:
-    priority: int
-    _counter: int = field(compare=True)
-    op: str = field(compare=False)
-    address: int = field(compare=False)
-    length: int = field(compare=False)
-    values: List[int] | None = field(compare=False, default=None)
-    future: asyncio.Future = field(compare=False, default_factory=asyncio.Future)
+    op: str
+    address: int
+    length: int
+    values: tuple[int, ...] | array | None = None
+    future: asyncio.Future | None = None  # always created via the owning loop
 
 
 class ModbusQueue:
-    """Priority queue per hub with simple read deduplication."""
+    """Two-lane FIFO queue per hub with simple read deduplication.
+
+    Only two priorities exist (writes before reads), so two deques and a
+    wakeup event replace the heap-backed PriorityQueue: O(1) enqueue and
+    dequeue, no comparisons between commands and no tie-break counter.
+    """
 
     def __init__(self, hass: HomeAssistant, mixin: "IsyGltModbusMixin") -> None:
         self.hass = hass
         self._hub_name = mixin._hub_name
         self._mixin = mixin
-        self._queue: asyncio.PriorityQueue[HubCommand] = asyncio.PriorityQueue()
-        self._counter = 0
+        # The queue lives on one loop; cache it so futures come from
+        # loop.create_future() without a get_running_loop TLS fetch.
+        self._loop = hass.loop
+        self._hi: deque[HubCommand] = deque()  # writes (priority 0)
+        self._lo: deque[HubCommand] = deque()  # reads (priority 1)
+        self._wake = asyncio.Event()
         self._pending_reads: dict[tuple[int, int], HubCommand] = {}
+        # Pending read spans as (start, end, cmd) sorted by start, so a
+        # new read contained in an in-flight one shares its reply.
+        self._pending_spans: list[tuple[int, int, HubCommand]] = []
         self._task = hass.loop.create_task(self._worker())
 
-    def _next_counter(self) -> int:
-        self._counter += 1
-        return self._counter
+    # Maximum registers fused into one read; below the FC03 limit of 125
+    _FUSE_LIMIT = 120
+
+    def _collect_read_batch(self, cmd: HubCommand) -> tuple[list[HubCommand], int, int]:
+        """Pull queued reads contiguous with ``cmd`` into one span.
+
+        Returns the batched commands plus the merged (start, length);
+        the span never exceeds ``_FUSE_LIMIT`` registers.
+        """
+        batch = [cmd]
+        start = cmd.address
+        end = cmd.address + cmd.length  # exclusive
+        merged = True
+        while merged:
+            merged = False
+            for other in self._lo:
+                if other.op != "read":
+                    continue
+                o_start = other.address
+                o_end = o_start + other.length
+                if o_start > end or o_end < start:
+                    continue  # disjoint, not even abutting
+                if max(end, o_end) - min(start, o_start) > self._FUSE_LIMIT:
+                    continue
+                self._lo.remove(other)
+                batch.append(other)
+                start = min(start, o_start)
+                end = max(end, o_end)
+                merged = True
+                break
+        return batch, start, end - start
 
     async def _worker(self):
-        """Process commands one at a time serially."""
+        """Process commands one at a time serially, writes first."""
         while True:
-            cmd: HubCommand = await self._queue.get()
-            try:
-                if cmd.op == "read":
-                    result = await self._mixin._direct_read(cmd.address, cmd.length)
-                    if not cmd.future.done():
-                        cmd.future.set_result(result)
-                else:  # write
-                    await self._mixin._direct_write(cmd.address, cmd.values or [])
+            await self._wake.wait()
+            if self._hi:
+                cmd = self._hi.popleft()
+            elif self._lo:
+                cmd = self._lo.popleft()
+            else:
+                self._wake.clear()
+                continue
+            if cmd.op == "read":
+                # Fuse adjacent queued reads into one bus transaction and
+                # slice the reply back to each awaiting future.
+                batch, start, length = self._collect_read_batch(cmd)
+                try:
+                    registers = await self._mixin._direct_read(start, length)
+                except Exception as exc:  # noqa: BLE001
+                    for c in batch:
+                        if not c.future.done():
+                            c.future.set_exception(exc)
+                else:
+                    for c in batch:
+                        if c.future.done():
+                            continue
+                        if registers is None:
+                            c.future.set_result(None)
+                        else:
+                            off = c.address - start
+                            c.future.set_result(list(registers[off:off + c.length]))
+                finally:
+                    for c in batch:
+                        self._pending_reads.pop((c.address, c.length), None)
+                        self._discard_span(c)
+            else:  # write
+                try:
+                    await self._mixin._direct_write(cmd.address, cmd.values or ())
                     if not cmd.future.done():
                         cmd.future.set_result(True)
-            except Exception as exc:  # noqa: BLE001
-                if not cmd.future.done():
-                    cmd.future.set_exception(exc)
-            finally:
-                if cmd.op == "read":
-                    self._pending_reads.pop((cmd.address, cmd.length), None)
-                self._queue.task_done()
+                except Exception as exc:  # noqa: BLE001
+                    if not cmd.future.done():
+                        cmd.future.set_exception(exc)
+
+    def _discard_span(self, cmd: HubCommand) -> None:
+        """Drop a completed read from the pending-span index."""
+        entry = (cmd.address, cmd.address + cmd.length, cmd)
+        i = bisect_right(self._pending_spans, cmd.address, key=lambda t: t[0])
+        for j in range(i - 1, -1, -1):
+            if self._pending_spans[j] == entry:
+                del self._pending_spans[j]
+                return
+            if self._pending_spans[j][0] < cmd.address:
+                break
+
+    def _find_containing(self, start: int, end: int) -> HubCommand | None:
+        """Return a pending read whose span covers [start, end), if any."""
+        i = bisect_right(self._pending_spans, start, key=lambda t: t[0])
+        for j in range(i - 1, -1, -1):
+            s, e, cmd = self._pending_spans[j]
+            if e >= end:
+                return cmd
+        return None
 
     def enqueue_read(self, address: int, length: int, priority: int) -> asyncio.Future:
         key = (address, length)
         if key in self._pending_reads:
             return self._pending_reads[key].future
-        fut: asyncio.Future = asyncio.get_running_loop().create_future()
-        cmd = HubCommand(priority, self._next_counter(), "read", address, length, None, fut)
+
+        end = address + length
+        container = self._find_containing(address, end)
+        if container is not None:
+            # Ride along on the wider in-flight read and slice its reply
+            fut: asyncio.Future = self._loop.create_future()
+            off = address - container.address
+
+            def _propagate_slice(source: asyncio.Future) -> None:
+                if fut.done():
+                    return
+                if source.cancelled():
+                    fut.cancel()
+                    return
+                exc = source.exception()
+                if exc is not None:
+                    fut.set_exception(exc)
+                    return
+                regs = source.result()
+                fut.set_result(None if regs is None else regs[off:off + length])
+
+            container.future.add_done_callback(_propagate_slice)
+            return fut
+
+        fut = self._loop.create_future()
+        cmd = HubCommand("read", address, length, None, fut)
         self._pending_reads[key] = cmd
-        self._queue.put_nowait(cmd)
+        insort(self._pending_spans, (address, end, cmd), key=lambda t: t[0])
+        (self._hi if priority == 0 else self._lo).append(cmd)
+        self._wake.set()
         return fut
 
     def enqueue_write(self, address: int, values: List[int], priority: int) -> asyncio.Future:
-        fut: asyncio.Future = asyncio.get_running_loop().create_future()
-        cmd = HubCommand(priority, self._next_counter(), "write", address, len(values), values, fut)
-        self._queue.put_nowait(cmd)
+        fut: asyncio.Future = self._loop.create_future()
+        # Snapshot the payload so later caller mutation cannot corrupt a
+        # queued write; uint16 arrays are copied compactly, everything
+        # else is frozen into a tuple.
+        if isinstance(values, array):
+            values_t = values[:]
+        else:
+            values_t = tuple(values)
+        cmd = HubCommand("write", address, len(values_t), values_t, fut)
+        (self._hi if priority == 0 else self._lo).append(cmd)
+        self._wake.set()
         return fut
 
 # --------------------------------------------------------
@@ -93,18 +264,18 @@ class ModbusQueue:
 class IsyGltModbusMixin:
     """Mixin that provides helper methods for reading/writing Modbus registers via the HA Modbus hub."""
 
+    # Shared per-hub command queues; defined on the class so instance
+    # construction never needs a hasattr guard.
+    _hub_queues: dict[str, "ModbusQueue"] = {}
+
     def __init__(self, hass: HomeAssistant, hub_name: str):
         self.hass = hass
         self._hub_name = hub_name
-        # Cache config entry id linkage
-        self._config_entry_id: str | None = None
-        # bulk cache
-        self._cache_data: list[int] | None = None
-        self._cache_ts: float = 0.0
+        # Domain state dict and its hot sub-dicts, resolved once instead
+        # of re-walking hass.data on every read/write.
+        self._domain_data = hass.data.setdefault(DOMAIN, {})
 
         # Create per-hub lock to prevent concurrent Modbus calls
-        if not hasattr(IsyGltModbusMixin, "_hub_queues"):
-            IsyGltModbusMixin._hub_queues = {}
         if hub_name not in IsyGltModbusMixin._hub_queues:
             IsyGltModbusMixin._hub_queues[hub_name] = ModbusQueue(hass, self)
         self._queue: ModbusQueue = IsyGltModbusMixin._hub_queues[hub_name]
@@ -119,90 +290,20 @@ class IsyGltModbusMixin:
             if entry and entry.device_id != self.device_entry.id:
                 ent_reg.async_update_entity(self.entity_id, device_id=self.device_entry.id)
 
-    # ---------- device registry helper ----------
-
-    def ensure_device_entry(self, base_id: str, name: str, model: str):
-        """Create or fetch device registry entry for this entity."""
-        from homeassistant.helpers import device_registry as dr
-
-        dev_reg = dr.async_get(self.hass)
-
-        # 1. prefer an isyglt config-entry that matches this hub
-        ceid = None
-        for entry in self.hass.config_entries.async_entries(DOMAIN):
-            if entry.title == self._hub_name:
-                ceid = entry.entry_id
-                break
-        if ceid is None:
-            # 2. fallback: first isyglt entry
-            entries = self.hass.config_entries.async_entries(DOMAIN)
-            if entries:
-                ceid = entries[0].entry_id
-            else:
-                # 3. last resort: create a new dummy entry so we never fall back to Sun
-                ceid = self.hass.config_entries.async_create(
-                    domain=DOMAIN,
-                    title=self._hub_name,
-                    data={},
-                ).entry_id
-
-        return dev_reg.async_get_or_create(
-            config_entry_id=ceid,
-            identifiers={(DOMAIN, base_id)},
-            manufacturer="ISYGLT",
-            name=name,
-            model=model,
-        )
-
-    @property
-    def config_entry_id(self) -> str | None:
-        """Try to find the Modbus config entry id matching our hub."""
-        if self._config_entry_id is not None:
-            return self._config_entry_id
-
-        modbus_entries = self.hass.config_entries.async_entries("modbus")
-
-        # Try exact match on hub name in title or data
-        for entry in modbus_entries:
-            if entry.title == self._hub_name or entry.data.get("name") == self._hub_name:
-                self._config_entry_id = entry.entry_id
-                return self._config_entry_id
-
-        # Fallback: first Modbus entry if available
-        if modbus_entries:
-            self._config_entry_id = modbus_entries[0].entry_id
-        return self._config_entry_id
-
     @property
     def hub(self):
+        # Looked up fresh each time: hass.data[MODBUS_DOMAIN] is swapped
+        # out when the modbus integration reloads, and a cached object
+        # would keep pointing at the closed hub until restart.
         return self.hass.data[MODBUS_DOMAIN][self._hub_name]
 
     async def async_read_registers(self, address: int, count: int = 1) -> List[int] | None:
-        """Read holding registers via cached bulk read.
+        """Read holding registers through the per-hub queue.
 
-        Uses the public `async_pb_call` helper introduced in recent HA
-        releases. Returns a list of 16-bit register values or `None` on
-        failure.
+        Returns a list of 16-bit register values or `None` on failure.
         """
-
-        poll_interval = self.hass.data.get(DOMAIN, {}).get("poll_interval", 1.0)
-        BLOCK_SIZE = 120  # safe chunk size <= 125
-
-        result_regs: list[int] = []
-        remaining = count
-        cur_addr = address
-
-        if not hasattr(self, "_block_cache"):
-            self._block_cache = {}
-
-        cache: dict[int, tuple[float, list[int]]] = self._block_cache  # start_addr -> (ts, data)
-
-        ranges = self.hass.data.get(DOMAIN, {}).get("bulk_range", {}).get(self._hub_name, [])
-
         # Priority 1 for normal reads
-        fut = self._queue.enqueue_read(address, count, priority=1)
-        data = await fut
-        return data
+        return await self._queue.enqueue_read(address, count, priority=1)
 
     # ---------------- direct low-level read/write (internal) -------------
 
@@ -215,9 +316,12 @@ class IsyGltModbusMixin:
             value=count,
             use_call=CALL_TYPE_REGISTER_HOLDING,
         )
-        if not result or getattr(result, "registers", None) is None:
+        # EAFP: the attribute exists on every successful call, so the
+        # try costs nothing on the hot path.
+        try:
+            return result.registers
+        except AttributeError:
             return None
-        return result.registers
 
     async def _direct_write(self, address: int, values: List[int]):
         await self.hub.async_pb_call(
@@ -230,38 +334,6 @@ class IsyGltModbusMixin:
 
     async def async_write_registers(self, address: int, values: List[int]):
         """Write multiple holding registers via the Modbus hub."""
-
         # priority 0 for state changes
         await self._queue.enqueue_write(address, values, priority=0)
 
-        # Patch cache for each word written
-        if hasattr(self, "_block_cache"):
-            BLOCK_SIZE = 120
-            for idx, val in enumerate(values):
-                addr = address + idx
-                block_start = (addr // BLOCK_SIZE) * BLOCK_SIZE
-                if block_start in self._block_cache:
-                    ts, data = self._block_cache[block_start]
-                    offset = addr - block_start
-                    if offset < len(data):
-                        data[offset] = val & 0xFFFF
-                        self._block_cache[block_start] = (ts, data)
-
-        now_time = time.monotonic()
-
-        # record write time per hub to help throttling reads
-        self.hass.data.setdefault(DOMAIN, {}).setdefault("last_write", {})[
-            self._hub_name
-        ] = now_time
-
-        # throttle bulk reads
-        poll_int = self.hass.data.get(DOMAIN, {}).get("poll_interval", 1.0)
-        self.hass.data[DOMAIN].setdefault("bulk_throttle", {})[self._hub_name] = now_time + poll_int
-
-        # schedule delayed dispatcher
-        PROP_DELAY = poll_int + poll_int  # two cycles
-
-        self.hass.loop.call_later(
-            PROP_DELAY,
-            lambda: async_dispatcher_send(self.hass, "isyglt_reg_updated"),
-        ) 
\ No newline at end of file
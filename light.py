@@ -1,7 +1,6 @@
 import logging
+from array import array
 from typing import Any, List
-from datetime import timedelta
-import asyncio
 
 from homeassistant.components.light import (
     ATTR_BRIGHTNESS,
@@ -11,11 +10,9 @@ from homeassistant.components.light import (
     LightEntity,
 )
 from homeassistant.const import CONF_NAME
+from homeassistant.core import callback
 from homeassistant.helpers.entity import Entity
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
-from homeassistant.helpers import device_registry as dr
-from homeassistant.util import slugify
-
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .const import (
     DOMAIN,
     CONF_ADDRESS,
@@ -28,12 +25,10 @@ from .const import (
     LIGHT_REGISTER_COUNT_WHITE,
     LIGHT_REGISTER_COUNT_DIMMER,
 )
-from .helpers import IsyGltModbusMixin
+from .helpers import IsyGltModbusMixin, build_device_meta
 
 _LOGGER = logging.getLogger(__name__)
 
-SCAN_INTERVAL = timedelta(seconds=1)
-
 
 async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
     """Set up ISYGLT lights from discovery info."""
@@ -45,42 +40,45 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
 
     entities: List[Entity] = []
 
-    # Adjust scan interval if provided
-    if "poll_interval" in discovery_info:
-        global SCAN_INTERVAL
-        base = float(discovery_info["poll_interval"])
-        SCAN_INTERVAL = timedelta(seconds=base * 2)
-
     for dev in devices:
-        if dev["type"] == DEVICE_TYPE_RGB_LIGHT:
-            entities.append(IsyGltRGBLight(hass, hub_name, dev))
-        elif dev["type"] == DEVICE_TYPE_WHITE_LIGHT:
-            entities.append(IsyGltWhiteLight(hass, hub_name, dev))
-        elif dev["type"] == DEVICE_TYPE_DIMMER:
-            entities.append(IsyGltDimmerLight(hass, hub_name, dev))
+        cls = _LIGHT_CLASSES.get(dev["type"])
+        if cls is None:
+            continue
+        base_id, device_info, device_entry = build_device_meta(hass, hub_name, dev)
+        entities.append(cls(hass, hub_name, dev, base_id, device_info, device_entry))
 
     if entities:
         async_add_entities(entities)
 
 
-class IsyGltBaseLight(IsyGltModbusMixin, LightEntity):
-    """Common logic for ISYGLT lights."""
+async def async_setup_entry(hass, entry, async_add_entities):
+    """Set up ISYGLT lights from a config entry (forwarded platforms)."""
+    data = hass.data[DOMAIN]
+    await async_setup_platform(
+        hass,
+        {},
+        async_add_entities,
+        discovery_info={
+            "devices": data.get("devices", []),
+            "hub": data.get("hub"),
+            "poll_interval": data.get("poll_interval", 1.0),
+        },
+    )
+
+
+class IsyGltBaseLight(IsyGltModbusMixin, CoordinatorEntity, LightEntity):
+    """Common logic for ISYGLT lights, fed by the shared hub coordinator."""
 
-    def __init__(self, hass, hub_name: str, cfg: dict):
+    def __init__(self, hass, hub_name: str, cfg: dict, base_id: str, device_info: dict, device_entry):
         IsyGltModbusMixin.__init__(self, hass, hub_name)
+        CoordinatorEntity.__init__(self, hass.data[DOMAIN]["coordinator"][hub_name])
         self._name = cfg[CONF_NAME]
         self._address = cfg[CONF_ADDRESS]
-        # Device info for grouping
-        base_id = f"{hub_name}_{slugify(cfg[CONF_NAME])}_{cfg['type']}"
-        self.device_entry = self.ensure_device_entry(base_id, cfg[CONF_NAME], cfg["type"])
-
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, base_id)},
-            "name": cfg[CONF_NAME],
-            "manufacturer": "ISYGLT",
-            "model": cfg["type"],
-            "via_device": None,
-        }
+        # Device metadata and its registry entry are resolved once per
+        # device in setup and shared across all of its entities
+        self.device_entry = device_entry
+
+        self._attr_device_info = device_info
 
         if self.device_entry:
             self._attr_device_id = self.device_entry.id
@@ -93,31 +91,95 @@ class IsyGltBaseLight(IsyGltModbusMixin, LightEntity):
         self._is_on = False
         self._brightness = 255
         self._rgb_color = (255, 255, 255)
-        self._available = True
-        self._unsubscribe_dispatcher = async_dispatcher_connect(
-            hass, "isyglt_reg_updated", self.async_schedule_update_ha_state
-        )
+        self._last_success = True
+
+    async def async_added_to_hass(self):
+        await super().async_added_to_hass()
+        # Tell the coordinator exactly which registers this light decodes
+        end = getattr(self, "_address_end", self._address)
+        self.coordinator.register_range(self._address, end - self._address + 1)
+        # Seed decoded state from the pre-setup refresh: the coordinator
+        # already holds a frame by the time entities are added, and a
+        # quiet bus means the changed-set gate would otherwise leave the
+        # __init__ defaults on screen (and feed them back into writes).
+        data = self.coordinator.data
+        if data is not None:
+            self._decode(data)
 
     @property
     def available(self) -> bool:
-        return self._available
+        data = self.coordinator.data
+        return (
+            self.coordinator.last_update_success
+            and data is not None
+            and data.get(self._address) is not None
+        )
 
     @property
     def name(self):
         return self._name
 
-    async def async_will_remove_from_hass(self):
-        if self._unsubscribe_dispatcher:
-            self._unsubscribe_dispatcher()
-
-    # Home Assistant's default async_turn_on/turn_off expect blocking versions.
-    # Provide sync stubs executed in executor threads which delegate to our async implementation.
-
-    def turn_on(self, **kwargs):  # type: ignore[override]
-        asyncio.run_coroutine_threadsafe(self._async_set_power(True, **kwargs), self.hass.loop).result()
-
-    def turn_off(self, **kwargs):  # type: ignore[override]
-        asyncio.run_coroutine_threadsafe(self._async_set_power(False, **kwargs), self.hass.loop).result()
+    def _decode(self, data: dict) -> None:
+        """Refresh internal state from the coordinator register map."""
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        coordinator = self.coordinator
+        success = coordinator.last_update_success
+        # Quiet frame for this light's registers and no availability
+        # flip: nothing to re-render, skip the state machine entirely.
+        if (
+            success
+            and self._last_success
+            and not coordinator.changed_in(
+                self._address, getattr(self, "_address_end", self._address)
+            )
+        ):
+            return
+        self._last_success = success
+        data = coordinator.data
+        if data is not None:
+            self._decode(data)
+        super()._handle_coordinator_update()
+
+    async def _write_if_changed(self, regs) -> None:
+        """Write this light's registers, skipping values already on the bus.
+
+        Compared against the coordinator's register image: when nothing
+        differs the write is dropped entirely (turn_on on an already-on
+        light), otherwise only the shortest contiguous slice of changed
+        registers is written. Written values are mirrored back into the
+        image so back-to-back service calls diff against fresh state.
+        """
+        address = self._address
+        coordinator = self.coordinator
+        data = coordinator.data
+        if data is not None and coordinator.last_update_success:
+            changed = [
+                off
+                for off, val in enumerate(regs)
+                if data.get(address + off) is None
+                or (data[address + off] & 0xFF) != (val & 0xFF)
+            ]
+            if not changed:
+                return
+            first, last = changed[0], changed[-1]
+            address += first
+            regs = regs[first:last + 1]
+        await self.async_write_registers(address, regs)
+        for off, val in enumerate(regs):
+            coordinator.mirror_write(address + off, val)
+
+    async def async_turn_on(self, **kwargs):
+        await self._async_set_power(True, **kwargs)
+        # Render the optimistic state now: with the write mirrored into
+        # the coordinator image, the next refresh sees no change for
+        # these registers and will not re-render on our behalf.
+        self.async_write_ha_state()
+
+    async def async_turn_off(self, **kwargs):
+        await self._async_set_power(False, **kwargs)
+        self.async_write_ha_state()
 
     async def _async_set_power(self, turn_on: bool, **kwargs):
         raise NotImplementedError()
@@ -128,8 +190,8 @@ class IsyGltRGBLight(IsyGltBaseLight):
 
     _attr_supported_color_modes = {ColorMode.RGB}
 
-    def __init__(self, hass, hub_name: str, cfg: dict):
-        super().__init__(hass, hub_name, cfg)
+    def __init__(self, hass, hub_name: str, cfg: dict, base_id: str, device_info: dict, device_entry):
+        super().__init__(hass, hub_name, cfg, base_id, device_info, device_entry)
         self._attr_unique_id = f"{self._base_unique}_rgb"
         self._address_end = self._address + LIGHT_REGISTER_COUNT_RGB - 1
 
@@ -149,19 +211,14 @@ class IsyGltRGBLight(IsyGltBaseLight):
     def is_on(self):
         return self._is_on
 
-    async def async_update(self):
-        regs = await self.async_read_registers(self._address, LIGHT_REGISTER_COUNT_RGB)
-        if regs is None:
-            self._available = False
+    def _decode(self, data: dict) -> None:
+        regs = [data.get(self._address + off) for off in range(LIGHT_REGISTER_COUNT_RGB)]
+        if None in regs:
             return
-        self._available = True
         # each register low byte only holds 0-255; high bytes may hold next channel
         ch0 = regs[0] & 0xFF
         dim_val = regs[1] & 0xFF
-        r = regs[2] & 0xFF
-        g = regs[3] & 0xFF
-        b = regs[4] & 0xFF
-        self._rgb_color = (r, g, b)
+        self._rgb_color = (regs[2] & 0xFF, regs[3] & 0xFF, regs[4] & 0xFF)
         self._is_on = bool(ch0 & 0x01)
         self._brightness = dim_val if (ch0 & 0x02) else 255
 
@@ -188,7 +245,7 @@ class IsyGltRGBLight(IsyGltBaseLight):
                 return
             ch0 = regs[0] & 0xFE  # clear power bit (bit0)
             regs[0] = ch0
-            await self.async_write_registers(self._address, regs)
+            await self._write_if_changed(regs)
 
             self._is_on = False
             # keep brightness and color unchanged
@@ -206,8 +263,10 @@ class IsyGltRGBLight(IsyGltBaseLight):
             if dim_val != 255:
                 ch0 |= 0x02  # DIM_EN (bit1)
 
-        regs = [ch0, dim_val, rgb_raw[0], rgb_raw[1], rgb_raw[2]]
-        await self.async_write_registers(self._address, regs)
+        # Compact uint16 buffer; the write queue snapshots it without
+        # boxing each value into a Python int object.
+        regs = array("H", (ch0, dim_val, rgb_raw[0], rgb_raw[1], rgb_raw[2]))
+        await self._write_if_changed(regs)
 
         # Optimistically update internal state
         self._rgb_color = current_rgb
@@ -220,11 +279,12 @@ class IsyGltWhiteLight(IsyGltBaseLight):
 
     _attr_supported_color_modes = {ColorMode.COLOR_TEMP}
 
-    def __init__(self, hass, hub_name: str, cfg: dict):
-        super().__init__(hass, hub_name, cfg)
+    def __init__(self, hass, hub_name: str, cfg: dict, base_id: str, device_info: dict, device_entry):
+        super().__init__(hass, hub_name, cfg, base_id, device_info, device_entry)
         self._attr_unique_id = f"{self._base_unique}_white"
         self._cct_min = cfg[CONF_CCT_MIN]
         self._cct_max = cfg[CONF_CCT_MAX]
+        self._cct_span = self._cct_max - self._cct_min
 
         # Home Assistant 2026.1 deprecates mireds defaults. Explicitly
         # expose Kelvin limits via the new attributes so we avoid the
@@ -250,12 +310,10 @@ class IsyGltWhiteLight(IsyGltBaseLight):
     def is_on(self):
         return self._is_on
 
-    async def async_update(self):
-        regs = await self.async_read_registers(self._address, LIGHT_REGISTER_COUNT_WHITE)
-        if regs is None:
-            self._available = False
+    def _decode(self, data: dict) -> None:
+        regs = [data.get(self._address + off) for off in range(LIGHT_REGISTER_COUNT_WHITE)]
+        if None in regs:
             return
-        self._available = True
         ch0 = regs[0] & 0xFF
         cct_value = regs[1] & 0xFF
         dim_value = regs[2] & 0xFF
@@ -265,10 +323,10 @@ class IsyGltWhiteLight(IsyGltBaseLight):
         dim_enabled = bool(ch0 & 0x04)
 
         if cct_enabled:
-            # Inverted mapping: 0 -> coldest (max Kelvin), 255 -> warmest (min Kelvin)
-            self._color_temp_kelvin = int(
-                self._cct_max - (self._cct_max - self._cct_min) * (cct_value / 255)
-            )
+            # Inverted mapping: 0 -> coldest (max Kelvin), 255 -> warmest
+            # (min Kelvin); integer math with round-to-nearest so the last
+            # kelvin step is not truncated away.
+            self._color_temp_kelvin = self._cct_max - (self._cct_span * cct_value + 127) // 255
         if dim_enabled:
             self._brightness = int(dim_value)
         else:
@@ -282,19 +340,11 @@ class IsyGltWhiteLight(IsyGltBaseLight):
         if turn_on:
             ch0 |= 0x01  # POWER ENABLE
         # Determine if CCT or dimming changed
-        # Inverted mapping: higher Kelvin produces lower register value
-        cct_value = int(
-            max(
-                0,
-                min(
-                    255,
-                    int(
-                        (self._cct_max - color_temp)
-                        / (self._cct_max - self._cct_min)
-                        * 255
-                    ),
-                ),
-            )
+        # Inverted mapping: higher Kelvin produces lower register value;
+        # all-integer with round-to-nearest on the span division
+        cct_value = max(
+            0,
+            min(255, ((self._cct_max - color_temp) * 255 + self._cct_span // 2) // self._cct_span),
         )
         if cct_value != 127:  # assume middle is no change
             ch0 |= 0x02  # CCT_ENABLE
@@ -302,12 +352,8 @@ class IsyGltWhiteLight(IsyGltBaseLight):
         if dim_value != 255:
             ch0 |= 0x04  # DIM_MODE
 
-        regs = [0, 0, 0]
-        regs[0] = ch0
-        regs[1] = cct_value
-        regs[2] = dim_value
-
-        await self.async_write_registers(self._address, regs)
+        regs = array("H", (ch0, cct_value, dim_value))
+        await self._write_if_changed(regs)
         self._is_on = turn_on
         self._brightness = brightness
         self._color_temp_kelvin = color_temp 
@@ -318,8 +364,8 @@ class IsyGltDimmerLight(IsyGltBaseLight):
 
     _attr_supported_color_modes = {ColorMode.BRIGHTNESS}
 
-    def __init__(self, hass, hub_name: str, cfg: dict):
-        super().__init__(hass, hub_name, cfg)
+    def __init__(self, hass, hub_name: str, cfg: dict, base_id: str, device_info: dict, device_entry):
+        super().__init__(hass, hub_name, cfg, base_id, device_info, device_entry)
         self._attr_unique_id = f"{self._base_unique}_dimmer"
         self._address_end = self._address + LIGHT_REGISTER_COUNT_DIMMER - 1
 
@@ -335,12 +381,10 @@ class IsyGltDimmerLight(IsyGltBaseLight):
     def is_on(self):
         return self._is_on
 
-    async def async_update(self):
-        regs = await self.async_read_registers(self._address, LIGHT_REGISTER_COUNT_DIMMER)
-        if regs is None:
-            self._available = False
+    def _decode(self, data: dict) -> None:
+        regs = [data.get(self._address + off) for off in range(LIGHT_REGISTER_COUNT_DIMMER)]
+        if None in regs:
             return
-        self._available = True
         ch0 = regs[0] & 0xFF
         dim_value = regs[1] & 0xFF
 
@@ -363,8 +407,15 @@ class IsyGltDimmerLight(IsyGltBaseLight):
         if dim_value != 255:
             ch0 |= 0x02  # DIM enable
 
-        regs = [ch0, dim_value]
-        await self.async_write_registers(self._address, regs)
+        regs = array("H", (ch0, dim_value))
+        await self._write_if_changed(regs)
 
         self._is_on = turn_on
-        self._brightness = brightness 
\ No newline at end of file
+        self._brightness = brightness 
+
+
+_LIGHT_CLASSES = {
+    DEVICE_TYPE_RGB_LIGHT: IsyGltRGBLight,
+    DEVICE_TYPE_WHITE_LIGHT: IsyGltWhiteLight,
+    DEVICE_TYPE_DIMMER: IsyGltDimmerLight,
+}
@@ -1,28 +1,23 @@
 from __future__ import annotations
 
 import logging
-from datetime import timedelta
 from typing import List
 
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass
 from homeassistant.const import CONF_NAME
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.core import callback
 from homeassistant.helpers.entity import Entity
-from homeassistant.helpers import device_registry as dr
-from homeassistant.util import slugify
-
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .const import (
     DEVICE_TYPE_MOTION_SENSOR,
     CONF_ADDRESS,
     CONF_PRESCALER,
     DOMAIN,
 )
-from .helpers import IsyGltModbusMixin
+from .helpers import IsyGltModbusMixin, build_device_meta
 
 _LOGGER = logging.getLogger(__name__)
 
-SCAN_INTERVAL = timedelta(seconds=1)
-
 
 async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
     if discovery_info is None:
@@ -33,76 +28,93 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
 
     entities: List[Entity] = []
 
-    if discovery_info and "poll_interval" in discovery_info:
-        global SCAN_INTERVAL
-        base = float(discovery_info["poll_interval"])
-        # add small buffer to avoid warning from long update vs interval
-        SCAN_INTERVAL = timedelta(seconds=base * 2.5)
-
     for dev in devices:
         if dev.get("type") == DEVICE_TYPE_MOTION_SENSOR:
-            entities.append(IsyGltIlluminanceSensor(hass, hub_name, dev))
+            meta = build_device_meta(hass, hub_name, dev)
+            entities.append(IsyGltIlluminanceSensor(hass, hub_name, dev, *meta))
 
     if entities:
         async_add_entities(entities)
 
 
-class IsyGltIlluminanceSensor(IsyGltModbusMixin, SensorEntity):
+async def async_setup_entry(hass, entry, async_add_entities):
+    """Set up ISYGLT sensors from a config entry (forwarded platforms)."""
+    data = hass.data[DOMAIN]
+    await async_setup_platform(
+        hass,
+        {},
+        async_add_entities,
+        discovery_info={
+            "devices": data.get("devices", []),
+            "hub": data.get("hub"),
+            "poll_interval": data.get("poll_interval", 1.0),
+        },
+    )
+
+
+class IsyGltIlluminanceSensor(IsyGltModbusMixin, CoordinatorEntity, SensorEntity):
     """Illuminance sensor exposed by an ISYGLT motion sensor (16-bit value)."""
 
     _attr_device_class = SensorDeviceClass.ILLUMINANCE
     _attr_native_unit_of_measurement = "lx"
 
-    def __init__(self, hass, hub_name: str, cfg: dict):
+    def __init__(self, hass, hub_name: str, cfg: dict, base_id: str, device_info: dict, device_entry):
         IsyGltModbusMixin.__init__(self, hass, hub_name)
+        CoordinatorEntity.__init__(self, hass.data[DOMAIN]["coordinator"][hub_name])
         self._name_prefix = cfg[CONF_NAME]
         self._address = cfg[CONF_ADDRESS] + 1  # CH1 is base+1 (high byte)
         self._prescaler: float = float(cfg.get(CONF_PRESCALER, 1))
-        base_id = f"{hub_name}_{slugify(cfg[CONF_NAME])}_{cfg['type']}"
-        self.device_entry = self.ensure_device_entry(base_id, cfg[CONF_NAME], cfg["type"])
+        # Device metadata and its registry entry are resolved once per
+        # device in setup and shared across all of its entities
+        self.device_entry = device_entry
 
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, base_id)},
-            "name": cfg[CONF_NAME],
-            "manufacturer": "ISYGLT",
-            "model": cfg["type"],
-        }
+        self._attr_device_info = device_info
 
         if self.device_entry:
             self._attr_device_id = self.device_entry.id
 
         self._base_unique = base_id
         self._attr_unique_id = f"{base_id}_lux"
-
-        dev_reg = dr.async_get(hass)
-        # Device registry auto-creation via _attr_device_info
-        self._available = True
         self._attr_name = f"{self._name_prefix} Illuminance"
-        self._native_value: int | None = None
-        self._unsubscribe = async_dispatcher_connect(
-            hass, "isyglt_reg_updated", self.async_schedule_update_ha_state
-        )
-
-    async def async_will_remove_from_hass(self):
-        if self._unsubscribe:
-            self._unsubscribe()
+        self._last_success = True
+
+    async def async_added_to_hass(self):
+        await super().async_added_to_hass()
+        # high and low byte registers of the illuminance word
+        self.coordinator.register_range(self._address, 2)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        coordinator = self.coordinator
+        success = coordinator.last_update_success
+        if (
+            success
+            and self._last_success
+            and not coordinator.changed_in(self._address, self._address + 1)
+        ):
+            return
+        self._last_success = success
+        super()._handle_coordinator_update()
 
     @property
     def available(self):
-        return self._available
+        data = self.coordinator.data
+        return (
+            self.coordinator.last_update_success
+            and data is not None
+            and data.get(self._address) is not None
+            and data.get(self._address + 1) is not None
+        )
 
     @property
     def native_value(self):
-        return self._native_value
-
-    async def async_update(self):
-        # read two registers: high byte (CH1) and low byte (CH2)
-        regs = await self.async_read_registers(self._address, 2)
-        if regs is None:
-            self._available = False
-            return
-        self._available = True
-        high = regs[0] & 0xFF
-        low = regs[1] & 0xFF
-        raw = (high << 8) | low
-        self._native_value = raw / self._prescaler 
\ No newline at end of file
+        # high byte on CH1, low byte on CH2
+        data = self.coordinator.data
+        if data is None:
+            return None
+        high = data.get(self._address)
+        low = data.get(self._address + 1)
+        if high is None or low is None:
+            return None
+        raw = ((high & 0xFF) << 8) | (low & 0xFF)
+        return raw / self._prescaler 
\ No newline at end of file
@@ -1,15 +1,11 @@
 import logging
 from typing import List
-from datetime import timedelta
-import asyncio
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.const import CONF_NAME
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.core import callback
 from homeassistant.helpers.entity import Entity
-from homeassistant.helpers import device_registry as dr
-from homeassistant.util import slugify
-
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .const import (
     CONF_ADDRESS,
     DEVICE_TYPE_IO_MODULE,
@@ -19,34 +15,13 @@ from .const import (
     CONF_BIT,
     DOMAIN,
 )
-from .helpers import IsyGltModbusMixin
+from .helpers import IsyGltModbusMixin, build_device_meta
 
 _LOGGER = logging.getLogger(__name__)
 
-IO_OUTPUT_BITS = {
-    1: 0x01,
-    2: 0x02,
-    3: 0x04,
-    4: 0x08,
-    5: 0x10,
-    6: 0x20,
-    7: 0x40,
-    8: 0x80,
-}
-
-BUTTON_LED_BITS = {
-    1: 0x01,
-    2: 0x02,
-    3: 0x04,
-    4: 0x08,
-    5: 0x10,
-    6: 0x20,
-}
 BACKLIGHT_BIT = 0x40  # CH1 bit 7 (1-indexed)
 MOTION_LED_BIT = 0x80  # CH0 bit 7
 
-SCAN_INTERVAL = timedelta(seconds=1)
-
 
 async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
     if discovery_info is None:
@@ -57,96 +32,154 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
 
     entities: List[Entity] = []
 
-    if discovery_info and "poll_interval" in discovery_info:
-        global SCAN_INTERVAL
-        base = float(discovery_info["poll_interval"])
-        SCAN_INTERVAL = timedelta(seconds=base * 2)
-
     for dev in devices:
         dev_type = dev.get("type")
         if dev_type == DEVICE_TYPE_IO_MODULE:
-            for idx in range(1, 9):
-                entities.append(IsyGltIOOutputSwitch(hass, hub_name, dev, idx))
+            meta = build_device_meta(hass, hub_name, dev)
+            entities.extend(
+                IsyGltIOOutputSwitch(hass, hub_name, dev, *meta, idx) for idx in range(1, 9)
+            )
         elif dev_type == DEVICE_TYPE_MOTION_SENSOR:
-            entities.append(IsyGltMotionLedSwitch(hass, hub_name, dev))
+            meta = build_device_meta(hass, hub_name, dev)
+            entities.append(IsyGltMotionLedSwitch(hass, hub_name, dev, *meta))
         elif dev_type == DEVICE_TYPE_GROUP_SWITCH:
             bit = dev.get(CONF_BIT, 1)
-            entities.append(IsyGltGroupSwitch(hass, hub_name, dev, bit))
+            meta = build_device_meta(hass, hub_name, dev)
+            entities.append(IsyGltGroupSwitch(hass, hub_name, dev, *meta, bit))
         elif dev_type == DEVICE_TYPE_BUTTON_GRID:
-            for idx in range(1, 7):
-                entities.append(IsyGltButtonLedSwitch(hass, hub_name, dev, idx))
-            entities.append(IsyGltBacklightSwitch(hass, hub_name, dev))
+            meta = build_device_meta(hass, hub_name, dev)
+            entities.extend(
+                IsyGltButtonLedSwitch(hass, hub_name, dev, *meta, idx) for idx in range(1, 7)
+            )
+            entities.append(IsyGltBacklightSwitch(hass, hub_name, dev, *meta))
 
     if entities:
         async_add_entities(entities)
 
 
-class IsyGltBaseSwitch(IsyGltModbusMixin, SwitchEntity):
-    def __init__(self, hass, hub_name, cfg):
+async def async_setup_entry(hass, entry, async_add_entities):
+    """Set up ISYGLT switches from a config entry (forwarded platforms)."""
+    data = hass.data[DOMAIN]
+    await async_setup_platform(
+        hass,
+        {},
+        async_add_entities,
+        discovery_info={
+            "devices": data.get("devices", []),
+            "hub": data.get("hub"),
+            "poll_interval": data.get("poll_interval", 1.0),
+        },
+    )
+
+
+class IsyGltBaseSwitch(IsyGltModbusMixin, CoordinatorEntity, SwitchEntity):
+    """Bit-level switch deriving its state from the shared hub coordinator."""
+
+    def __init__(self, hass, hub_name, cfg, base_id, device_info, device_entry):
         IsyGltModbusMixin.__init__(self, hass, hub_name)
+        CoordinatorEntity.__init__(self, hass.data[DOMAIN]["coordinator"][hub_name])
         self._name_prefix = cfg[CONF_NAME]
         self._address = cfg[CONF_ADDRESS]
-        base_id = f"{hub_name}_{slugify(cfg[CONF_NAME])}_{cfg['type']}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, base_id)},
-            "name": self._name_prefix,
-            "manufacturer": "ISYGLT",
-            "model": cfg["type"],
-        }
+        # Register holding this switch's bit; LED subclasses point it at CH1
+        self._state_address = self._address
+        self._bitmask = 0
+        self._bit_index = 0
+        # Device metadata and its registry entry are resolved once per
+        # device in setup and shared across all of its entities
+        self._attr_device_info = device_info
 
-        self.device_entry = self.ensure_device_entry(base_id, self._name_prefix, cfg["type"])
+        self.device_entry = device_entry
 
         if self.device_entry:
             self._attr_device_id = self.device_entry.id
 
         self._base_unique = base_id
+        self._last_success = True
 
-        dev_reg = dr.async_get(hass)
-        # Device registry auto-creation via _attr_device_info
-        self._available = True
-        self._is_on = False
-        self._unsubscribe = async_dispatcher_connect(
-            hass, "isyglt_reg_updated", self.async_schedule_update_ha_state
-        )
+    async def async_added_to_hass(self):
+        await super().async_added_to_hass()
+        self._bit_index = self._bitmask.bit_length() - 1
+        self.coordinator.register_range(self._state_address, 1)
 
     @property
     def available(self):
-        return self._available
+        data = self.coordinator.data
+        return (
+            self.coordinator.last_update_success
+            and data is not None
+            and data.get(self._state_address) is not None
+        )
 
     @property
     def is_on(self):
-        return self._is_on
-
-    async def async_will_remove_from_hass(self):
-        if self._unsubscribe:
-            self._unsubscribe()
-
-    # Provide blocking API expected by ToggleEntity
-
-    def turn_on(self, **kwargs):  # type: ignore[override]
-        asyncio.run_coroutine_threadsafe(self.async_turn_on(**kwargs), self.hass.loop).result()
-
-    def turn_off(self, **kwargs):  # type: ignore[override]
-        asyncio.run_coroutine_threadsafe(self.async_turn_off(**kwargs), self.hass.loop).result()
+        # Pure getter over the coordinator's lane table; writes are
+        # mirrored into it, so optimistic state needs no shadow copy.
+        lanes = self.coordinator.bits.get(self._state_address)
+        return lanes is not None and bool(lanes[self._bit_index])
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        coordinator = self.coordinator
+        success = coordinator.last_update_success
+        if (
+            success
+            and self._last_success
+            and self._state_address not in coordinator.changed
+        ):
+            return
+        self._last_success = success
+        super()._handle_coordinator_update()
+
+    async def _current_byte(self, address: int) -> int | None:
+        """Low byte of a register for read-modify-write.
+
+        Served from the coordinator's register image when the last
+        refresh succeeded; only a stale image costs a bus read.
+        """
+        coordinator = self.coordinator
+        data = coordinator.data
+        if data is not None and coordinator.last_update_success:
+            value = data.get(address)
+            if value is not None:
+                return value & 0xFF
+        regs = await self.async_read_registers(address, 1)
+        if regs is None:
+            return None
+        return regs[0] & 0xFF
+
+    async def _write_bit(self, address: int, turn_on: bool, *, require_read: bool = False) -> bool:
+        """Set or clear this switch's bit at ``address`` and write it back."""
+        current = await self._current_byte(address)
+        value = current if current is not None else 0
+        if current is None and require_read:
+            return False
+        if turn_on:
+            value |= self._bitmask
+        else:
+            value &= ~self._bitmask & 0xFF
+        if value == current:
+            # Bit already in the requested state on the bus; no write,
+            # but render so a stale toggle snaps back immediately.
+            self.async_write_ha_state()
+            return True
+        await self.async_write_registers(address, [value])
+        # Mirror the write into the shared image so sibling bit-entities
+        # on the same register modify the fresh value, not a stale one,
+        # then render: is_on reads the mirrored lane, and the next
+        # refresh will see these registers as unchanged and skip us.
+        self.coordinator.mirror_write(address, value)
+        self.async_write_ha_state()
+        return True
 
 
 class IsyGltIOOutputSwitch(IsyGltBaseSwitch):
-    def __init__(self, hass, hub_name, cfg, output_idx: int):
-        super().__init__(hass, hub_name, cfg)
+    def __init__(self, hass, hub_name, cfg, base_id, device_info, device_entry, output_idx: int):
+        super().__init__(hass, hub_name, cfg, base_id, device_info, device_entry)
         self._output_idx = output_idx
-        self._bitmask = IO_OUTPUT_BITS[output_idx]
+        self._bitmask = 1 << (output_idx - 1)
         self._attr_name = f"{self._name_prefix} Output {output_idx}"
         self._attr_unique_id = f"{self._base_unique}_out{output_idx}"
 
-    async def async_update(self):
-        regs = await self.async_read_registers(self._address, 1)
-        if regs is None:
-            self._available = False
-            return
-        self._available = True
-        value = regs[0] & 0xFF
-        self._is_on = bool(value & self._bitmask)
-
     async def async_turn_on(self, **kwargs):
         await self._write_state(True)
 
@@ -154,39 +187,21 @@ class IsyGltIOOutputSwitch(IsyGltBaseSwitch):
         await self._write_state(False)
 
     async def _write_state(self, turn_on: bool):
-        regs = await self.async_read_registers(self._address, 1)
-        if regs is None:
-            return
-        value = regs[0] & 0xFF
-        if turn_on:
-            value |= self._bitmask
-        else:
-            value &= ~self._bitmask & 0xFF
-        await self.async_write_registers(self._address, [value])
-        self._is_on = turn_on
+        await self._write_bit(self._address, turn_on, require_read=True)
 
 
 class IsyGltButtonLedSwitch(IsyGltBaseSwitch):
     """Status LED for each button on grid."""
 
-    def __init__(self, hass, hub_name, cfg, button_idx: int):
-        super().__init__(hass, hub_name, cfg)
+    def __init__(self, hass, hub_name, cfg, base_id, device_info, device_entry, button_idx: int):
+        super().__init__(hass, hub_name, cfg, base_id, device_info, device_entry)
         self._button_idx = button_idx
-        self._bitmask = BUTTON_LED_BITS[button_idx]
+        self._bitmask = 1 << (button_idx - 1)
         self._led_address = self._address + 1  # CH1
+        self._state_address = self._led_address
         self._attr_name = f"{self._name_prefix} Button {button_idx} LED"
         self._attr_unique_id = f"{self._base_unique}_led{button_idx}"
 
-    async def async_update(self):
-        regs = await self.async_read_registers(self._led_address, 1)
-        if regs is None:
-            self._available = False
-            value = 0
-        else:
-            self._available = True
-            value = regs[0] & 0xFF
-        self._is_on = bool(value & self._bitmask)
-
     async def async_turn_on(self, **kwargs):
         await self._write_state(True)
 
@@ -194,49 +209,39 @@ class IsyGltButtonLedSwitch(IsyGltBaseSwitch):
         await self._write_state(False)
 
     async def _write_state(self, turn_on: bool):
-        regs = await self.async_read_registers(self._led_address, 1)
-        if regs is None:
-            value = 0
-        else:
-            value = regs[0] & 0xFF
-        if turn_on:
-            value |= self._bitmask
-        else:
-            value &= ~self._bitmask & 0xFF
-        await self.async_write_registers(self._led_address, [value])
-        self._is_on = turn_on
+        await self._write_bit(self._led_address, turn_on)
 
 
 class IsyGltBacklightSwitch(IsyGltBaseSwitch):
     """Backlight LED for button grid."""
 
-    def __init__(self, hass, hub_name, cfg):
-        super().__init__(hass, hub_name, cfg)
+    def __init__(self, hass, hub_name, cfg, base_id, device_info, device_entry):
+        super().__init__(hass, hub_name, cfg, base_id, device_info, device_entry)
         self._bitmask = BACKLIGHT_BIT
         self._led_address = self._address + 1  # CH1
+        self._state_address = self._led_address
         self._attr_name = f"{self._name_prefix} Backlight"
         self._attr_unique_id = f"{self._base_unique}_backlight"
 
+    async def async_turn_on(self, **kwargs):
+        await self._write_state(True)
+
+    async def async_turn_off(self, **kwargs):
+        await self._write_state(False)
+
+    async def _write_state(self, turn_on: bool):
+        await self._write_bit(self._led_address, turn_on)
+
 
 class IsyGltGroupSwitch(IsyGltBaseSwitch):
     """Group switch controlling single bit in configured channel."""
 
-    def __init__(self, hass, hub_name, cfg, bit_pos: int):
-        super().__init__(hass, hub_name, cfg)
+    def __init__(self, hass, hub_name, cfg, base_id, device_info, device_entry, bit_pos: int):
+        super().__init__(hass, hub_name, cfg, base_id, device_info, device_entry)
         self._bitmask = 1 << (bit_pos - 1)
         self._attr_name = f"{self._name_prefix} Group {bit_pos}"
         self._attr_unique_id = f"{self._base_unique}_grp{bit_pos}"
 
-    async def async_update(self):
-        regs = await self.async_read_registers(self._address, 1)
-        if regs is None:
-            self._available = False
-            value = 0
-        else:
-            self._available = True
-            value = regs[0] & 0xFF
-        self._is_on = bool(value & self._bitmask)
-
     async def async_turn_on(self, **kwargs):
         await self._write_state(True)
 
@@ -244,37 +249,18 @@ class IsyGltGroupSwitch(IsyGltBaseSwitch):
         await self._write_state(False)
 
     async def _write_state(self, turn_on: bool):
-        regs = await self.async_read_registers(self._address, 1)
-        if regs is None:
-            value = 0
-        else:
-            value = regs[0] & 0xFF
-        if turn_on:
-            value |= self._bitmask
-        else:
-            value &= ~self._bitmask & 0xFF
-        await self.async_write_registers(self._address, [value])
-        self._is_on = turn_on
+        await self._write_bit(self._address, turn_on)
 
 
 class IsyGltMotionLedSwitch(IsyGltBaseSwitch):
     """LED indicator on motion sensor"""
 
-    def __init__(self, hass, hub_name, cfg):
-        super().__init__(hass, hub_name, cfg)
+    def __init__(self, hass, hub_name, cfg, base_id, device_info, device_entry):
+        super().__init__(hass, hub_name, cfg, base_id, device_info, device_entry)
         self._bitmask = MOTION_LED_BIT
         self._attr_name = f"{self._name_prefix} LED"
         self._attr_unique_id = f"{self._base_unique}_led"
 
-    async def async_update(self):
-        regs = await self.async_read_registers(self._address, 1)
-        if regs is None:
-            self._available = False
-            return
-        self._available = True
-        value = regs[0] & 0xFF
-        self._is_on = bool(value & self._bitmask)
-
     async def async_turn_on(self, **kwargs):
         await self._write_state(True)
 
@@ -282,13 +268,4 @@ class IsyGltMotionLedSwitch(IsyGltBaseSwitch):
         await self._write_state(False)
 
     async def _write_state(self, turn_on: bool):
-        regs = await self.async_read_registers(self._address, 1)
-        if regs is None:
-            return
-        value = regs[0] & 0xFF
-        if turn_on:
-            value |= self._bitmask
-        else:
-            value &= ~self._bitmask & 0xFF
-        await self.async_write_registers(self._address, [value])
-        self._is_on = turn_on 
\ No newline at end of file
+        await self._write_bit(self._address, turn_on, require_read=True) 
\ No newline at end of file